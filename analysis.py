@@ -2,413 +2,798 @@
 from config import *
 
 import librosa
-import librosa.display
 import numpy as np
-import matplotlib.pyplot as plt
-from scipy import signal
-import glob
+import soundfile as sf
+import argparse
+import functools
+import importlib.util
+import multiprocessing
 import os
+from types import MappingProxyType
+from core.reuse_helpers import (CACHE_DIR, ReusableFigure, code_version, file_digest,
+                                load_cache_entry, save_figure_png, store_cache_entry)
 
+# Numba is optional - without it the classification kernel runs as plain Python
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
 
-def analyze_cat_meow(file_path):
+    def njit(*args, **kwargs):
+        """Fallback for numba.njit that leaves the function uncompiled"""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+# pyFFTW is optional and opt-in (see enable_pyfftw)
+PYFFTW_AVAILABLE = importlib.util.find_spec('pyfftw') is not None
+
+# Modules whose code decides the memoized meow features (see cache_analysis)
+FEATURE_SOURCE_FILES = ('analysis.py', 'config.py')
+
+# Recordings picked up by the batch run in __main__
+AUDIO_EXTENSIONS = ('.m4a', '.wav', '.mp3', '.flac', '.ogg')
+
+
+def enable_pyfftw():
+    """
+    Send librosa's STFTs through pyFFTW, if installed, whose plan cache lets
+    all recordings (same n_fft) reuse a single FFT plan. This switches the
+    FFT backend of every librosa user in the process, so only the batch run
+    and its worker processes call it - importing this module changes nothing.
+
+    Returns:
+        Whether pyFFTW is now in use
+    """
+    if not PYFFTW_AVAILABLE:
+        return False
+    import pyfftw
+    pyfftw.interfaces.cache.enable()
+    librosa.set_fftlib(pyfftw.interfaces.numpy_fft)
+    return True
+
+
+def cache_analysis(func):
+    """
+    Memoize an audio analysis step on disk, keyed by the file's content hash,
+    the code and librosa version that produced it (see code_version), the
+    analysis rate, and whether the recording was streamed or loaded. An entry
+    is reused only while all of these are unchanged: previously seen
+    recordings - even renamed, copied or merely touched ones - then skip
+    loading, feature extraction and plotting entirely. The analysis graph is
+    cached with the result and written back on a hit, since the video
+    pipelines move it out of the working directory after every analysis.
+    """
+    @functools.wraps(func)
+    def wrapper(file_path, *args, generate_plot=True, **kwargs):
+        kwargs['generate_plot'] = generate_plot
+        try:
+            digest = file_digest(file_path)
+        except OSError:
+            return func(file_path, *args, **kwargs)
+
+        # Streamed and loaded features differ slightly at the block edges,
+        # so each mode (and analysis rate) gets its own entry
+        mode = 'stream' if not generate_plot and _should_stream(file_path) else 'load'
+        key = (f"{func.__name__}-{code_version(*FEATURE_SOURCE_FILES)}-{mode}"
+               f"-{AUDIO_ANALYSIS_SAMPLE_RATE}-{digest}")
+        cache_path = os.path.join(CACHE_DIR, f"{key}.pkl")
+        base_name = os.path.splitext(os.path.basename(file_path))[0]
+        output_filename = f"meow_analysis_{base_name}.png"
+
+        # (result, PNG bytes of the graph or None if none was drawn)
+        entry = load_cache_entry(cache_path)
+        if entry is not None:
+            result, graph = entry
+            if not generate_plot or graph is not None:
+                if generate_plot:
+                    with open(output_filename, 'wb') as f:
+                        f.write(graph)
+                print(f"♻️ Using cached analysis for: {file_path}")
+                return result
+
+        result = func(file_path, *args, **kwargs)
+
+        graph = None
+        if generate_plot and os.path.exists(output_filename):
+            with open(output_filename, 'rb') as f:
+                graph = f.read()
+        try:
+            store_cache_entry(cache_path, (result, graph))
+        except Exception as e:
+            print(f"⚠️ Could not cache analysis for {file_path}: {e}")
+
+        return result
+
+    return wrapper
+
+
+class RunningStats:
+    """Running mean/std that can absorb a block of values at a time (Welford)"""
+
+    def __init__(self):
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def update(self, values):
+        """Merge a block of values into the running statistics"""
+        values = np.asarray(values, dtype=np.float64)
+        n = values.size
+        if n == 0:
+            return
+        block_mean = values.mean()
+        block_m2 = np.square(values - block_mean).sum()
+        total = self.count + n
+        delta = block_mean - self.mean
+        self.mean += delta * n / total
+        self.m2 += block_m2 + delta * delta * self.count * n / total
+        self.count = total
+
+    @property
+    def std(self):
+        """Population standard deviation, like np.std"""
+        return (self.m2 / self.count) ** 0.5 if self.count else 0.0
+
+
+def _pitch_track(S, sr, n_fft=2048, fmin=150.0, fmax=4000.0, threshold=0.1):
+    """
+    Strongest pitch of every frame of a magnitude spectrogram, 0 if unvoiced.
+
+    Gives exactly what picking the top-magnitude bin of every
+    librosa.piptrack(S=S, sr=sr, threshold=threshold) frame does, but only
+    interpolates the fmin-fmax band (piptrack's defaults) and never builds
+    the full pitch/magnitude matrices.
+    """
+    freqs = librosa.fft_frequencies(sr=sr, n_fft=n_fft)
+    lo, hi = np.searchsorted(freqs, [fmin, fmax])
+    # Bin 0 and the Nyquist bin can never be peaks here, so every band bin
+    # has a neighbour on both sides
+    lo = max(lo, 1)
+    hi = min(hi, S.shape[0] - 1)
+    band = S[lo - 1:hi + 1]
+    prev, cur, nxt = band[:-2], band[1:-1], band[2:]
+
+    # Local maxima among the bins above threshold * frame peak
+    loud = band * (band > threshold * S.max(axis=0))
+    peaks = (loud[1:-1] > loud[:-2]) & (loud[1:-1] >= loud[2:])
+
+    # Parabolic interpolation, in the same precision as librosa's stencil
+    diff = nxt - prev
+    curvature = (nxt + prev).astype(np.float64) - 2 * cur.astype(np.float64)
+    slope = diff.astype(np.float64) / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        shift = np.where(np.abs(slope) >= np.abs(curvature), 0.0,
+                         -slope / curvature).astype(S.dtype)
+    magnitudes = np.where(peaks, cur + 0.5 * (diff / 2.0) * shift, 0)
+
+    best = np.argmax(magnitudes, axis=0)
+    frames = np.arange(S.shape[1])
+    pitches = ((best + lo + shift[best, frames]) * float(sr) / n_fft).astype(S.dtype)
+    return np.where(peaks[best, frames], pitches, 0)
+
+
+def _zero_crossing_rate(y, frame_length=2048, hop_length=512, threshold=1e-10):
+    """
+    Mean of librosa.feature.zero_crossing_rate(y) without framing the signal.
+
+    Every crossing is found once on the flat signal and weighted by how
+    many of librosa's (centered, edge-padded) frames contain it, instead of
+    being recounted in each of the ~frame_length / hop_length overlapping
+    frames.
+    """
+    if len(y) < 2:
+        return 0.0
+    # librosa's convention: |y| <= threshold is zero, and zero is positive
+    negative = y < -threshold
+    crossings = np.flatnonzero(negative[1:] != negative[:-1]) + 1
+
+    # Position in the padded signal; edge padding itself never crosses
+    pad = frame_length // 2
+    n_frames = 1 + (len(y) + 2 * pad - frame_length) // hop_length
+    j = crossings + pad
+    # Frames k with k * hop < j < k * hop + frame_length hold crossing j
+    first = np.maximum(-((frame_length - 1 - j) // hop_length), 0)
+    last = np.minimum((j - 1) // hop_length, n_frames - 1)
+    weight = np.maximum(last - first + 1, 0)
+    return weight.sum() / (n_frames * frame_length)
+
+
+@functools.lru_cache(maxsize=None)
+def _mel_basis(sr, n_fft=2048):
+    """Mel filter bank for the MFCC panel, built once per sample rate"""
+    basis = librosa.filters.mel(sr=sr, n_fft=n_fft)
+    # Shared between calls, so keep it from being modified in place
+    basis.flags.writeable = False
+    return basis
+
+
+def _should_stream(file_path):
+    """
+    Whether file_path is long enough to be analyzed block by block, and
+    already at the analysis rate. librosa.stream can't resample, and the
+    features of other rates would not match those of the loaded path.
+    """
+    try:
+        info = sf.info(file_path)
+    except RuntimeError:
+        # Not a soundfile format (m4a, mp3, ...) - librosa.stream can't read it
+        return False
+    return (info.duration > STREAM_MIN_DURATION
+            and info.samplerate == AUDIO_ANALYSIS_SAMPLE_RATE)
+
+
+def _stream_meow_features(file_path, frame_length=2048, hop_length=512):
+    """
+    Extract the meow features with librosa.stream, keeping only running
+    statistics so memory stays bounded however long the recording is.
+    librosa.stream cannot resample, so only recordings already at the
+    analysis rate are streamed (see _should_stream).
+
+    Returns:
+        (duration, avg_pitch, pitch_variation, avg_loudness,
+         loudness_variation, avg_spectral_centroid, avg_zcr)
+    """
+    info = sf.info(file_path)
+    sr = info.samplerate
+    freqs = librosa.fft_frequencies(sr=sr, n_fft=frame_length).astype(np.float32)
+    pitch, loudness, centroid, zcr = (RunningStats() for _ in range(4))
+
+    stream = librosa.stream(file_path, block_length=256,
+                            frame_length=frame_length, hop_length=hop_length,
+                            dtype=np.float32)
+    for y_block in stream:
+        # The trailing block can be shorter than a single frame
+        if len(y_block) < frame_length:
+            continue
+
+        S = np.abs(librosa.stft(y_block, n_fft=frame_length,
+                                hop_length=hop_length, center=False,
+                                dtype=np.complex64))
+
+        frame_pitches = _pitch_track(S, sr, n_fft=frame_length)
+        pitch.update(frame_pitches[frame_pitches > 0])
+
+        loudness.update(librosa.feature.rms(
+            y=y_block, frame_length=frame_length, hop_length=hop_length,
+            center=False)[0])
+        centroid.update(librosa.feature.spectral_centroid(
+            S=S, sr=sr, freq=freqs)[0])
+        zcr.update(librosa.feature.zero_crossing_rate(
+            y_block, frame_length=frame_length, hop_length=hop_length,
+            center=False)[0])
+
+    return (info.duration, pitch.mean, pitch.std, loudness.mean,
+            loudness.std, centroid.mean, zcr.mean)
+
+
+def _waveform_envelope(y, sr, target=2000):
+    """
+    Min/max envelope of y over ~target buckets for plotting, so the waveform
+    panel draws a few thousand points yet keeps every transient
+
+    Returns:
+        (times, y_min, y_max), one entry per bucket
+    """
+    stride = max(1, len(y) // target)
+    n = len(y) // stride
+    buckets = y[:n * stride].reshape(n, stride)
+    times = np.arange(n) * (stride / sr)
+    return times, buckets.min(axis=1), buckets.max(axis=1)
+
+
+def _create_meow_figure():
+    """
+    Create the (fig, axes, colorbar_axes) meow graphs are drawn on. Plotting
+    modules are imported on first use: runs without graphs (batch mode, the
+    web app's analysis step) never pay for them.
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.colorbar import make_axes_gridspec
+
+    # One grid with a shared time axis: the panels are created in a single
+    # call and only the bottom row draws time tick labels
+    fig, axes = plt.subplots(3, 2, figsize=(15, 10), dpi=120, sharex=True)
+    # Fixed colorbar slots for the spectrogram and MFCC panels, so redrawn
+    # colorbars don't steal more space from their panel every time
+    colorbar_axes = (make_axes_gridspec(axes[0, 1])[0],
+                     make_axes_gridspec(axes[2, 1])[0])
+    return fig, axes, colorbar_axes
+
+
+# Figure reused for every meow graph drawn by this process
+_MEOW_FIGURE = ReusableFigure(_create_meow_figure)
+
+
+def analyze_cat_meow(file_path, generate_plot=True):
     """
     Analyze a cat's meow audio file to interpret potential meanings
+
+    Args:
+        file_path: Path to the audio file
+        generate_plot: Save the meow_analysis_<name>.png graph. Disable for
+            batch runs that only need the interpretation.
     """
-    # Load the audio file
-    y, sr = librosa.load(file_path, sr=None)
+    # Only the acoustic features are cached - interpreting them is cheap, and
+    # rule changes in interpret_meow then apply to cached recordings too
+    return interpret_meow(*_meow_features(file_path, generate_plot=generate_plot))
+
+
+@cache_analysis
+def _meow_features(file_path, generate_plot=True):
+    """
+    Extract the acoustic features of a meow recording, drawing its analysis
+    graph on the way if requested
+
+    Returns:
+        (duration, avg_pitch, pitch_variation, avg_loudness,
+         loudness_variation, avg_spectral_centroid, avg_zcr)
+    """
+    # Long recordings are streamed instead of loaded whole (no graph then -
+    # it would need the full signal in memory anyway)
+    if not generate_plot and _should_stream(file_path):
+        return _stream_meow_features(file_path)
+
+    # Load the audio file, resampled to the analysis rate so every feature
+    # below works on fewer samples than the (often 44.1/48 kHz) source.
+    # Everything downstream stays in single precision - the features are
+    # thresholded to a few significant digits and float32 halves the memory
+    # traffic through the STFT frames
+    y, sr = librosa.load(file_path, sr=AUDIO_ANALYSIS_SAMPLE_RATE,
+                         dtype=np.float32)
 
     # Basic audio properties
     duration = len(y) / sr
 
+    # Magnitude spectrogram shared by pitch tracking, spectral features and
+    # the spectrogram plot so the signal is only framed and FFT'd once
+    S = np.abs(librosa.stft(y, dtype=np.complex64))
+
     # Extract key features
     # 1. Fundamental frequency (pitch)
-    pitches, magnitudes = librosa.piptrack(y=y, sr=sr, threshold=0.1)
-    pitch_values = []
-    for t in range(pitches.shape[1]):
-        index = magnitudes[:, t].argmax()
-        pitch = pitches[index, t]
-        if pitch > 0:
-            pitch_values.append(pitch)
+    # Strongest piptrack-style peak of every frame
+    frame_pitches = _pitch_track(S, sr)
+    voiced = frame_pitches > 0
+    pitch_values = frame_pitches[voiced]
 
-    avg_pitch = np.mean(pitch_values) if pitch_values else 0
-    pitch_variation = np.std(pitch_values) if pitch_values else 0
+    avg_pitch = pitch_values.mean() if pitch_values.size else 0.0
+    pitch_variation = pitch_values.std() if pitch_values.size else 0.0
 
     # 2. Intensity/loudness
+    # Kept in the time domain: cheaper than the spectral form and it keeps
+    # the amplitude scale the loudness thresholds were tuned against
     rms = librosa.feature.rms(y=y)[0]
     avg_loudness = np.mean(rms)
     loudness_variation = np.std(rms)
 
     # 3. Spectral features
-    spectral_centroids = librosa.feature.spectral_centroid(y=y, sr=sr)[0]
+    # float32 bin frequencies, otherwise librosa's float64 grid upcasts S
+    freqs = librosa.fft_frequencies(sr=sr).astype(np.float32)
+    spectral_centroids = librosa.feature.spectral_centroid(S=S, sr=sr,
+                                                           freq=freqs)[0]
     avg_spectral_centroid = np.mean(spectral_centroids)
 
     # 4. Zero crossing rate (roughness indicator)
-    zcr = librosa.feature.zero_crossing_rate(y)[0]
-    avg_zcr = np.mean(zcr)
-
-    # 5. MFCC features for vocal characteristics
-    mfccs = librosa.feature.mfcc(y=y, sr=sr, n_mfcc=13)
-
-    # Analyze meow characteristics and interpret meaning
-    interpretation = interpret_meow(duration, avg_pitch, pitch_variation,
-                                    avg_loudness, loudness_variation,
-                                    avg_spectral_centroid, avg_zcr)
-
-    # Create visualization
-    plt.figure(figsize=(15, 10))
-
-    # Waveform
-    plt.subplot(3, 2, 1)
-    plt.plot(np.linspace(0, duration, len(y)), y)
-    plt.title('Waveform')
-    plt.xlabel('Time (s)')
-    plt.ylabel('Amplitude')
-
-    # Spectrogram
-    plt.subplot(3, 2, 2)
-    D = librosa.amplitude_to_db(np.abs(librosa.stft(y)), ref=np.max)
-    librosa.display.specshow(D, sr=sr, x_axis='time', y_axis='hz')
-    plt.colorbar(format='%+2.0f dB')
-    plt.title('Spectrogram')
-
-    # Pitch contour
-    plt.subplot(3, 2, 3)
-    times = librosa.frames_to_time(np.arange(len(pitch_values)), sr=sr)
-    plt.plot(times[:len(pitch_values)], pitch_values)
-    plt.title('Pitch Contour')
-    plt.xlabel('Time (s)')
-    plt.ylabel('Frequency (Hz)')
-
-    # RMS Energy
-    plt.subplot(3, 2, 4)
-    times = librosa.frames_to_time(np.arange(len(rms)), sr=sr)
-    plt.plot(times, rms)
-    plt.title('RMS Energy (Loudness)')
-    plt.xlabel('Time (s)')
-    plt.ylabel('RMS')
-
-    # Spectral Centroid
-    plt.subplot(3, 2, 5)
-    times = librosa.frames_to_time(np.arange(len(spectral_centroids)), sr=sr)
-    plt.plot(times, spectral_centroids)
-    plt.title('Spectral Centroid')
-    plt.xlabel('Time (s)')
-    plt.ylabel('Hz')
-
-    # MFCC
-    plt.subplot(3, 2, 6)
-    librosa.display.specshow(mfccs, sr=sr, x_axis='time')
-    plt.colorbar()
-    plt.title('MFCC')
-
-    plt.tight_layout()
-
-    # Save the plot to the project folder
-    base_name = os.path.splitext(os.path.basename(file_path))[0]
-    output_filename = f"meow_analysis_{base_name}.png"
-    plt.savefig(output_filename, dpi=300, bbox_inches='tight')
-    print(f"Analysis graph saved as: {output_filename}")
-    plt.close()  # Close the figure to free memory
-
-    return interpretation
-
-
-def detect_vocal_patterns(duration, avg_pitch, pitch_variation, avg_loudness,
-                          loudness_variation, spectral_centroid, zcr):
+    avg_zcr = _zero_crossing_rate(y)
+
+    # Create visualization (optional - rendering dominates runtime on short clips)
+    if generate_plot:
+        from librosa.display import specshow
+
+        with _MEOW_FIGURE.lock:
+            fig, axes, colorbar_axes = _MEOW_FIGURE.get()
+
+            # Every frame-based feature uses the same hop, so one time grid
+            # serves the pitch, RMS and centroid panels
+            frame_times = librosa.frames_to_time(np.arange(S.shape[1]), sr=sr)
+
+            # Waveform, drawn as its min/max envelope over ~2k buckets
+            ax = axes[0, 0]
+            # (one line through each bucket's min and max, which looks the
+            # same as drawing every sample)
+            times, y_min, y_max = _waveform_envelope(y, sr)
+            ax.plot(np.repeat(times, 2), np.column_stack((y_min, y_max)).ravel(),
+                    linewidth=0.5)
+            ax.set_title('Waveform')
+            ax.set_ylabel('Amplitude')
+
+            # Spectrogram
+            ax = axes[0, 1]
+            D = librosa.amplitude_to_db(S, ref=np.max)
+            img = specshow(D, sr=sr, x_axis='time', y_axis='hz',
+                           rasterized=True, ax=ax)
+            fig.colorbar(img, cax=colorbar_axes[0], format='%+2.0f dB')
+            ax.set_title('Spectrogram')
+            ax.set_xlabel('')
+
+            # Pitch contour - each pitch placed at the frame it was found in
+            ax = axes[1, 0]
+            ax.plot(frame_times[voiced], pitch_values)
+            ax.set_title('Pitch Contour')
+            ax.set_ylabel('Frequency (Hz)')
+
+            # RMS Energy
+            ax = axes[1, 1]
+            ax.plot(frame_times, rms)
+            ax.set_title('RMS Energy (Loudness)')
+            ax.set_ylabel('RMS')
+
+            # Spectral Centroid
+            ax = axes[2, 0]
+            ax.plot(frame_times, spectral_centroids)
+            ax.set_title('Spectral Centroid')
+            ax.set_xlabel('Time (s)')
+            ax.set_ylabel('Hz')
+
+            # MFCC - only drawn, never interpreted, so it is computed here from
+            # the shared spectrogram rather than from a second STFT of y
+            ax = axes[2, 1]
+            mel = _mel_basis(sr) @ S**2
+            mfccs = librosa.feature.mfcc(S=librosa.power_to_db(mel), n_mfcc=13)
+            img = specshow(mfccs, sr=sr, x_axis='time', rasterized=True,
+                           ax=ax)
+            fig.colorbar(img, cax=colorbar_axes[1])
+            ax.set_title('MFCC')
+            ax.set_xlabel('Time (s)')
+
+            # The axes are shared, so this trims the autoscale margins of all
+            ax.set_xlim(0, duration)
+
+            fig.tight_layout()
+
+            # Save the plot to the project folder
+            base_name = os.path.splitext(os.path.basename(file_path))[0]
+            output_filename = f"meow_analysis_{base_name}.png"
+            save_figure_png(fig, output_filename)
+            print(f"Analysis graph saved as: {output_filename}")
+
+    return (duration, avg_pitch, pitch_variation, avg_loudness,
+            loudness_variation, avg_spectral_centroid, avg_zcr)
+
+
+# Description dicts reported by detect_meow_indicators. They are shared by
+# every call, so detecting a pattern doesn't rebuild its dict and strings;
+# read-only views keep one caller's edits from leaking into later results
+# (interpret_meow copies them into the plain dicts it returns)
+TRILL_PATTERN = MappingProxyType({
+    'pattern': 'trill_detected',
+    'description': 'Friendly social communication trill - indicates welcoming, social behavior often used in greeting familiar humans or other cats',
+    'confidence': 'High',
+    'behavioral_meaning': 'Social bonding, contentment, friendly approach'
+})
+
+CHIRP_PATTERN = MappingProxyType({
+    'pattern': 'chirp_pattern',
+    'description': 'Hunting instinct chirp - rapid, bird-like vocalization indicating prey interest or excitement about potential hunting opportunity',
+    'confidence': 'High',
+    'behavioral_meaning': 'Predatory excitement, environmental stimulation, hunting instincts'
+})
+
+PURR_MEOW_PATTERN = MappingProxyType({
+    'pattern': 'purr_meow_combo',
+    'description': 'Purr-meow combination - contentment mixed with specific request, indicating comfortable cat making polite demand',
+    'confidence': 'Medium',
+    'behavioral_meaning': 'Contentment with request, comfortable demanding, trust-based communication'
+})
+
+YOWLING_PATTERN = MappingProxyType({
+    'pattern': 'yowling_pattern',
+    'description': 'Yowling vocalization - intense, prolonged call indicating territorial behavior, mating calls, or significant distress',
+    'confidence': 'High',
+    'behavioral_meaning': 'Territorial assertion, mating behavior, distress, or medical discomfort'
+})
+
+SILENT_MEOW_PATTERN = MappingProxyType({
+    'pattern': 'silent_meow',
+    'description': 'Silent meow - visual communication with trusted human, indicates strong bond and expectation of attention without vocalization',
+    'confidence': 'Medium',
+    'behavioral_meaning': 'Trust-based communication, intimate bonding, confident expectation of response'
+})
+
+RAPID_SEQUENCE_PATTERN = MappingProxyType({
+    'pattern': 'rapid_sequence',
+    'description': 'Rapid sequence meow - part of quick succession indicating high urgency or excitement',
+    'confidence': 'Medium',
+    'behavioral_meaning': 'High urgency, excitement, impatience, demanding immediate attention'
+})
+
+DESCENDING_PITCH_PATTERN = MappingProxyType({
+    'pattern': 'descending_pitch',
+    'description': 'Descending pitch pattern - disappointment or resignation vocalization, often after unmet expectations',
+    'confidence': 'Medium',
+    'behavioral_meaning': 'Disappointment, resignation, mild frustration, unmet expectations'
+})
+
+ASCENDING_PITCH_PATTERN = MappingProxyType({
+    'pattern': 'ascending_pitch',
+    'description': 'Ascending pitch pattern - question-like vocalization indicating uncertainty or seeking confirmation',
+    'confidence': 'Medium',
+    'behavioral_meaning': 'Uncertainty, questioning, seeking confirmation or permission'
+})
+
+HARMONIC_RICHNESS_PATTERN = MappingProxyType({
+    'pattern': 'harmonic_richness',
+    'description': 'Harmonically rich vocalization - emotionally complex communication with sophisticated tonal qualities',
+    'confidence': 'High',
+    'behavioral_meaning': 'Emotional sophistication, complex communication intent, nuanced expression'
+})
+
+MORNING_DEMAND_CONTEXT = MappingProxyType({
+    'context': 'morning_demand_pattern',
+    'description': 'Morning demand characteristics - loud, high-pitched, brief vocalizations typical of breakfast requests or attention-seeking after overnight separation',
+    'likely_timing': 'Early morning (6-9 AM)',
+    'behavioral_context': 'Food demands, attention after separation, routine establishment'
+})
+
+EVENING_SOCIAL_CONTEXT = MappingProxyType({
+    'context': 'evening_social_pattern',
+    'description': 'Evening social characteristics - moderate pitch with expressive variation, typical of social interaction and bonding time',
+    'likely_timing': 'Evening (6-10 PM)',
+    'behavioral_context': 'Social bonding, play initiation, companionship seeking'
+})
+
+HIGH_URGENCY_CONTEXT = MappingProxyType({
+    'context': 'high_urgency_cluster',
+    'description': 'High urgency cluster - multiple indicators suggest immediate need or high motivation',
+    'urgency_level': 'Critical',
+    'behavioral_context': 'Immediate attention required, possible distress or strong need'
+})
+
+MODERATE_URGENCY_CONTEXT = MappingProxyType({
+    'context': 'moderate_urgency_cluster',
+    'description': 'Moderate urgency cluster - some urgency indicators present',
+    'urgency_level': 'Moderate',
+    'behavioral_context': 'Attention desired, routine request, mild impatience'
+})
+
+IRREGULAR_BREATH_CONTEXT = MappingProxyType({
+    'context': 'irregular_breath_pattern',
+    'description': 'Irregular breath pattern detected - volume fluctuations and vocal roughness may indicate stress or respiratory effort',
+    'health_concern': 'Monitor for stress or respiratory issues',
+    'behavioral_context': 'Possible stress, anxiety, or physical discomfort'
+})
+
+CONTROLLED_BREATH_CONTEXT = MappingProxyType({
+    'context': 'controlled_breath_pattern',
+    'description': 'Controlled breath pattern - steady volume and smooth vocalization indicates calm, deliberate communication',
+    'health_indicator': 'Good respiratory control and calm state',
+    'behavioral_context': 'Relaxed, controlled communication, good health indicators'
+})
+
+RESPIRATORY_CONCERN = MappingProxyType({
+    'category': 'respiratory_concern',
+    'severity': 'High',
+    'description': 'Significant vocal roughness detected - may indicate respiratory distress, upper respiratory infection, or throat irritation',
+    'recommendation': 'Veterinary examination recommended, especially if persistent or accompanied by other symptoms'
+})
+
+MILD_RESPIRATORY_ROUGHNESS = MappingProxyType({
+    'category': 'mild_respiratory_roughness',
+    'severity': 'Low',
+    'description': 'Mild vocal roughness - could indicate minor throat irritation, recent vocalization strain, or early respiratory symptoms',
+    'recommendation': 'Monitor for persistence or worsening, ensure adequate hydration'
+})
+
+VOCAL_STRAIN = MappingProxyType({
+    'category': 'vocal_strain',
+    'severity': 'Medium',
+    'description': 'High volume with significant variation may indicate vocal strain from excessive vocalization or underlying discomfort',
+    'recommendation': 'Monitor vocalization frequency, check for sources of stress or discomfort'
+})
+
+LOW_ENERGY_VOCALIZATION = MappingProxyType({
+    'category': 'low_energy_vocalization',
+    'severity': 'Medium',
+    'description': 'Very quiet, low-energy vocalization may indicate lethargy, illness, or depression',
+    'recommendation': 'Monitor for other signs of illness, changes in appetite, or behavioral changes'
+})
+
+PITCH_CONTROL_CONCERN = MappingProxyType({
+    'category': 'pitch_control_concern',
+    'severity': 'Medium',
+    'description': 'Extreme pitch variation in long vocalizations may indicate neurological issues or extreme distress',
+    'recommendation': 'Veterinary evaluation if pattern persists, especially with other neurological symptoms'
+})
+
+AGE_RELATED_CHANGES = MappingProxyType({
+    'category': 'age_related_changes',
+    'severity': 'Low',
+    'description': 'Low pitch with mild roughness may indicate age-related vocal changes in senior cats',
+    'recommendation': 'Normal aging process, but monitor for significant changes or discomfort'
+})
+
+
+def detect_meow_indicators(duration, avg_pitch, pitch_variation, avg_loudness,
+                           loudness_variation, spectral_centroid, zcr):
     """
-    Detect specific vocal patterns and characteristics in cat vocalizations
+    Detect vocal patterns, contextual indicators (time-of-day patterns,
+    frequency clusters, breath patterns) and health indicators in one pass
+    over the meow features
+
+    Returns:
+        (vocal_patterns, contextual_indicators, health_indicators)
     """
+    # Vocal patterns and characteristics
     patterns = []
 
     # Trill Pattern Detection
     if (pitch_variation > 80 and duration > 0.5 and spectral_centroid > 2000 and
             avg_pitch > 200 and zcr < 0.05):
-        patterns.append({
-            'pattern': 'trill_detected',
-            'description': 'Friendly social communication trill - indicates welcoming, social behavior often used in greeting familiar humans or other cats',
-            'confidence': 'High',
-            'behavioral_meaning': 'Social bonding, contentment, friendly approach'
-        })
+        patterns.append(TRILL_PATTERN)
 
     # Chirping Pattern Detection
     if (duration < 0.4 and avg_pitch > 400 and pitch_variation > 60 and
             spectral_centroid > 3000):
-        patterns.append({
-            'pattern': 'chirp_pattern',
-            'description': 'Hunting instinct chirp - rapid, bird-like vocalization indicating prey interest or excitement about potential hunting opportunity',
-            'confidence': 'High',
-            'behavioral_meaning': 'Predatory excitement, environmental stimulation, hunting instincts'
-        })
+        patterns.append(CHIRP_PATTERN)
 
     # Purr-Meow Combination Detection
     if (zcr < 0.03 and spectral_centroid < 1500 and duration > 0.8 and
             avg_loudness > 0.03 and pitch_variation < 30):
-        patterns.append({
-            'pattern': 'purr_meow_combo',
-            'description': 'Purr-meow combination - contentment mixed with specific request, indicating comfortable cat making polite demand',
-            'confidence': 'Medium',
-            'behavioral_meaning': 'Contentment with request, comfortable demanding, trust-based communication'
-        })
+        patterns.append(PURR_MEOW_PATTERN)
 
     # Yowling Pattern Detection
     if (duration > 2.0 and avg_pitch > 300 and pitch_variation > 100 and
             avg_loudness > 0.1):
-        patterns.append({
-            'pattern': 'yowling_pattern',
-            'description': 'Yowling vocalization - intense, prolonged call indicating territorial behavior, mating calls, or significant distress',
-            'confidence': 'High',
-            'behavioral_meaning': 'Territorial assertion, mating behavior, distress, or medical discomfort'
-        })
+        patterns.append(YOWLING_PATTERN)
 
     # Silent Meow Detection (very quiet with mouth movement)
     if (avg_loudness < 0.01 and duration > 0.3 and pitch_variation < 20):
-        patterns.append({
-            'pattern': 'silent_meow',
-            'description': 'Silent meow - visual communication with trusted human, indicates strong bond and expectation of attention without vocalization',
-            'confidence': 'Medium',
-            'behavioral_meaning': 'Trust-based communication, intimate bonding, confident expectation of response'
-        })
+        patterns.append(SILENT_MEOW_PATTERN)
 
     # Rapid Sequence Pattern (short duration, high urgency indicators)
     if (duration < 0.5 and avg_loudness > 0.08 and pitch_variation > 40):
-        patterns.append({
-            'pattern': 'rapid_sequence',
-            'description': 'Rapid sequence meow - part of quick succession indicating high urgency or excitement',
-            'confidence': 'Medium',
-            'behavioral_meaning': 'High urgency, excitement, impatience, demanding immediate attention'
-        })
+        patterns.append(RAPID_SEQUENCE_PATTERN)
 
     # Descending Pitch Pattern
     if (pitch_variation > 50 and avg_pitch > 250 and spectral_centroid < 2000):
-        patterns.append({
-            'pattern': 'descending_pitch',
-            'description': 'Descending pitch pattern - disappointment or resignation vocalization, often after unmet expectations',
-            'confidence': 'Medium',
-            'behavioral_meaning': 'Disappointment, resignation, mild frustration, unmet expectations'
-        })
+        patterns.append(DESCENDING_PITCH_PATTERN)
 
     # Ascending Pitch Pattern (question-like)
     if (pitch_variation > 60 and duration < 1.0 and spectral_centroid > 2500):
-        patterns.append({
-            'pattern': 'ascending_pitch',
-            'description': 'Ascending pitch pattern - question-like vocalization indicating uncertainty or seeking confirmation',
-            'confidence': 'Medium',
-            'behavioral_meaning': 'Uncertainty, questioning, seeking confirmation or permission'
-        })
+        patterns.append(ASCENDING_PITCH_PATTERN)
 
     # Harmonic Richness Detection
     if (spectral_centroid > 2000 and spectral_centroid < 4000 and zcr < 0.06 and
             pitch_variation > 30):
-        patterns.append({
-            'pattern': 'harmonic_richness',
-            'description': 'Harmonically rich vocalization - emotionally complex communication with sophisticated tonal qualities',
-            'confidence': 'High',
-            'behavioral_meaning': 'Emotional sophistication, complex communication intent, nuanced expression'
-        })
-
-    return patterns
+        patterns.append(HARMONIC_RICHNESS_PATTERN)
 
-
-def analyze_contextual_indicators(duration, avg_pitch, pitch_variation, avg_loudness,
-                                  loudness_variation, spectral_centroid, zcr):
-    """
-    Analyze contextual indicators for time-of-day patterns, frequency clusters, and breath patterns
-    """
+    # Contextual indicators
     indicators = []
 
     # Morning Demand Pattern (high urgency, demanding characteristics)
     if (avg_loudness > 0.1 and avg_pitch > 350 and duration < 1.0):
-        indicators.append({
-            'context': 'morning_demand_pattern',
-            'description': 'Morning demand characteristics - loud, high-pitched, brief vocalizations typical of breakfast requests or attention-seeking after overnight separation',
-            'likely_timing': 'Early morning (6-9 AM)',
-            'behavioral_context': 'Food demands, attention after separation, routine establishment'
-        })
+        indicators.append(MORNING_DEMAND_CONTEXT)
 
     # Evening Social Pattern (moderate, social characteristics)
     if (avg_pitch < 300 and pitch_variation > 40 and duration > 0.5 and
             spectral_centroid > 1500 and spectral_centroid < 3000):
-        indicators.append({
-            'context': 'evening_social_pattern',
-            'description': 'Evening social characteristics - moderate pitch with expressive variation, typical of social interaction and bonding time',
-            'likely_timing': 'Evening (6-10 PM)',
-            'behavioral_context': 'Social bonding, play initiation, companionship seeking'
-        })
+        indicators.append(EVENING_SOCIAL_CONTEXT)
 
-    # Urgency Cluster Analysis
-    urgency_score = 0
-    if avg_loudness > 0.08:
-        urgency_score += 2
-    if duration < 0.5:
-        urgency_score += 1
-    if pitch_variation > 50:
-        urgency_score += 2
-    if avg_pitch > 400:
-        urgency_score += 1
+    # Urgency Cluster Analysis (weighted sum of the urgency flags)
+    urgency_score = (2 * int(avg_loudness > 0.08) + int(duration < 0.5)
+                     + 2 * int(pitch_variation > 50) + int(avg_pitch > 400))
 
     if urgency_score >= 4:
-        indicators.append({
-            'context': 'high_urgency_cluster',
-            'description': 'High urgency cluster - multiple indicators suggest immediate need or high motivation',
-            'urgency_level': 'Critical',
-            'behavioral_context': 'Immediate attention required, possible distress or strong need'
-        })
+        indicators.append(HIGH_URGENCY_CONTEXT)
     elif urgency_score >= 2:
-        indicators.append({
-            'context': 'moderate_urgency_cluster',
-            'description': 'Moderate urgency cluster - some urgency indicators present',
-            'urgency_level': 'Moderate',
-            'behavioral_context': 'Attention desired, routine request, mild impatience'
-        })
+        indicators.append(MODERATE_URGENCY_CONTEXT)
 
     # Breath Pattern Analysis (stress indicators)
     if (loudness_variation > 0.04 and zcr > 0.08):
-        indicators.append({
-            'context': 'irregular_breath_pattern',
-            'description': 'Irregular breath pattern detected - volume fluctuations and vocal roughness may indicate stress or respiratory effort',
-            'health_concern': 'Monitor for stress or respiratory issues',
-            'behavioral_context': 'Possible stress, anxiety, or physical discomfort'
-        })
+        indicators.append(IRREGULAR_BREATH_CONTEXT)
     elif (loudness_variation < 0.02 and zcr < 0.04):
-        indicators.append({
-            'context': 'controlled_breath_pattern',
-            'description': 'Controlled breath pattern - steady volume and smooth vocalization indicates calm, deliberate communication',
-            'health_indicator': 'Good respiratory control and calm state',
-            'behavioral_context': 'Relaxed, controlled communication, good health indicators'
-        })
-
-    return indicators
+        indicators.append(CONTROLLED_BREATH_CONTEXT)
 
-
-def generate_health_indicators(duration, avg_pitch, pitch_variation, avg_loudness,
-                               loudness_variation, spectral_centroid, zcr):
-    """
-    Generate health-related indicators from vocal analysis
-    """
+    # Health-related indicators
     health_indicators = []
 
     # Respiratory Health Assessment
     if zcr > 0.12:
-        health_indicators.append({
-            'category': 'respiratory_concern',
-            'severity': 'High',
-            'description': 'Significant vocal roughness detected - may indicate respiratory distress, upper respiratory infection, or throat irritation',
-            'recommendation': 'Veterinary examination recommended, especially if persistent or accompanied by other symptoms'
-        })
+        health_indicators.append(RESPIRATORY_CONCERN)
     elif zcr > 0.08:
-        health_indicators.append({
-            'category': 'mild_respiratory_roughness',
-            'severity': 'Low',
-            'description': 'Mild vocal roughness - could indicate minor throat irritation, recent vocalization strain, or early respiratory symptoms',
-            'recommendation': 'Monitor for persistence or worsening, ensure adequate hydration'
-        })
+        health_indicators.append(MILD_RESPIRATORY_ROUGHNESS)
 
     # Vocal Strain Assessment
     if (avg_loudness > 0.15 and loudness_variation > 0.05):
-        health_indicators.append({
-            'category': 'vocal_strain',
-            'severity': 'Medium',
-            'description': 'High volume with significant variation may indicate vocal strain from excessive vocalization or underlying discomfort',
-            'recommendation': 'Monitor vocalization frequency, check for sources of stress or discomfort'
-        })
+        health_indicators.append(VOCAL_STRAIN)
 
     # Energy Level Assessment
     if (avg_loudness < 0.02 and spectral_centroid < 1000):
-        health_indicators.append({
-            'category': 'low_energy_vocalization',
-            'severity': 'Medium',
-            'description': 'Very quiet, low-energy vocalization may indicate lethargy, illness, or depression',
-            'recommendation': 'Monitor for other signs of illness, changes in appetite, or behavioral changes'
-        })
+        health_indicators.append(LOW_ENERGY_VOCALIZATION)
 
     # Neurological Function (pitch control assessment)
     if (pitch_variation > 150 and duration > 1.0):
-        health_indicators.append({
-            'category': 'pitch_control_concern',
-            'severity': 'Medium',
-            'description': 'Extreme pitch variation in long vocalizations may indicate neurological issues or extreme distress',
-            'recommendation': 'Veterinary evaluation if pattern persists, especially with other neurological symptoms'
-        })
+        health_indicators.append(PITCH_CONTROL_CONCERN)
 
     # Age-Related Changes
     if (avg_pitch < 150 and zcr > 0.06 and spectral_centroid < 1200):
-        health_indicators.append({
-            'category': 'age_related_changes',
-            'severity': 'Low',
-            'description': 'Low pitch with mild roughness may indicate age-related vocal changes in senior cats',
-            'recommendation': 'Normal aging process, but monitor for significant changes or discomfort'
-        })
-
-    return health_indicators
+        health_indicators.append(AGE_RELATED_CHANGES)
+
+    return patterns, indicators, health_indicators
+
+
+# Insights added by generate_behavioral_insights, shared like the pattern dicts
+# above. The tables are keyed by pattern/context name and listed in the order
+# the insights are reported
+PATTERN_INSIGHTS = MappingProxyType({
+    'trill_detected': MappingProxyType({
+        'category': 'social_behavior',
+        'insight': 'Cat is displaying friendly, social behavior with trill vocalizations - indicates comfort and positive social engagement',
+        'recommendation': 'Respond positively to encourage continued social bonding'
+    }),
+    'chirp_pattern': MappingProxyType({
+        'category': 'hunting_behavior',
+        'insight': 'Hunting instincts are activated - cat may be observing prey or showing predatory excitement',
+        'recommendation': 'Provide interactive toys or hunting-simulation play to satisfy natural instincts'
+    }),
+    'purr_meow_combo': MappingProxyType({
+        'category': 'comfortable_requesting',
+        'insight': 'Cat is in comfortable state while making requests - indicates trust and security in relationship',
+        'recommendation': 'Cat feels secure enough to make demands - maintain consistent care routine'
+    }),
+    'yowling_pattern': MappingProxyType({
+        'category': 'intense_communication',
+        'insight': 'Intense vocalization detected - may indicate territorial behavior, mating calls, or significant distress',
+        'recommendation': 'Investigate potential causes: territory issues, mating behavior, or sources of distress'
+    }),
+    'silent_meow': MappingProxyType({
+        'category': 'intimate_communication',
+        'insight': 'Silent meow indicates strong human-cat bond and expectation of visual communication response',
+        'recommendation': 'Respond with visual cues, gentle touch, or verbal acknowledgment to maintain bond'
+    })
+})
+
+CONTEXT_INSIGHTS = MappingProxyType({
+    'high_urgency_cluster': MappingProxyType({
+        'category': 'urgent_needs',
+        'insight': 'Multiple urgency indicators suggest immediate attention or care is needed',
+        'recommendation': 'Check for immediate needs: food, water, litter box, or potential distress sources'
+    }),
+    'morning_demand_pattern': MappingProxyType({
+        'category': 'routine_behavior',
+        'insight': 'Morning demand pattern suggests established routine and expectation of morning care',
+        'recommendation': 'Maintain consistent morning routine to reduce anxiety and demanding behavior'
+    }),
+    'evening_social_pattern': MappingProxyType({
+        'category': 'social_bonding',
+        'insight': 'Evening social pattern indicates desire for companionship and bonding time',
+        'recommendation': 'Dedicate evening time for interactive play and social bonding activities'
+    })
+})
+
+COMPLEX_COMMUNICATION_INSIGHT = MappingProxyType({
+    'category': 'complex_communication',
+    'insight': 'Multiple vocal patterns detected - cat is using sophisticated communication strategies',
+    'recommendation': 'Cat is highly communicative - pay attention to subtle vocal cues and respond appropriately'
+})
+
+HIGH_CONFIDENCE_INSIGHT = MappingProxyType({
+    'category': 'analysis_reliability',
+    'insight': 'High confidence analysis - vocal patterns are clear and interpretable',
+    'recommendation': 'Analysis results are highly reliable - act on recommendations with confidence'
+})
+
+LOW_CONFIDENCE_INSIGHT = MappingProxyType({
+    'category': 'analysis_uncertainty',
+    'insight': 'Lower confidence analysis - vocal patterns may be ambiguous or unusual',
+    'recommendation': 'Consider additional context and observe other behavioral cues for complete understanding'
+})
 
 
 def generate_behavioral_insights(interpretation, vocal_patterns, contextual_indicators, health_indicators):
     """
     Generate comprehensive behavioral insights by combining all analysis results
     """
-    insights = []
-
     # Pattern-based insights
-    pattern_types = [p['pattern'] for p in vocal_patterns]
-
-    if 'trill_detected' in pattern_types:
-        insights.append({
-            'category': 'social_behavior',
-            'insight': 'Cat is displaying friendly, social behavior with trill vocalizations - indicates comfort and positive social engagement',
-            'recommendation': 'Respond positively to encourage continued social bonding'
-        })
-
-    if 'chirp_pattern' in pattern_types:
-        insights.append({
-            'category': 'hunting_behavior',
-            'insight': 'Hunting instincts are activated - cat may be observing prey or showing predatory excitement',
-            'recommendation': 'Provide interactive toys or hunting-simulation play to satisfy natural instincts'
-        })
-
-    if 'purr_meow_combo' in pattern_types:
-        insights.append({
-            'category': 'comfortable_requesting',
-            'insight': 'Cat is in comfortable state while making requests - indicates trust and security in relationship',
-            'recommendation': 'Cat feels secure enough to make demands - maintain consistent care routine'
-        })
-
-    if 'yowling_pattern' in pattern_types:
-        insights.append({
-            'category': 'intense_communication',
-            'insight': 'Intense vocalization detected - may indicate territorial behavior, mating calls, or significant distress',
-            'recommendation': 'Investigate potential causes: territory issues, mating behavior, or sources of distress'
-        })
-
-    if 'silent_meow' in pattern_types:
-        insights.append({
-            'category': 'intimate_communication',
-            'insight': 'Silent meow indicates strong human-cat bond and expectation of visual communication response',
-            'recommendation': 'Respond with visual cues, gentle touch, or verbal acknowledgment to maintain bond'
-        })
+    pattern_types = {p['pattern'] for p in vocal_patterns}
+    insights = [insight for pattern, insight in PATTERN_INSIGHTS.items()
+                if pattern in pattern_types]
 
     # Contextual insights
-    context_types = [c['context'] for c in contextual_indicators]
-
-    if 'high_urgency_cluster' in context_types:
-        insights.append({
-            'category': 'urgent_needs',
-            'insight': 'Multiple urgency indicators suggest immediate attention or care is needed',
-            'recommendation': 'Check for immediate needs: food, water, litter box, or potential distress sources'
-        })
-
-    if 'morning_demand_pattern' in context_types:
-        insights.append({
-            'category': 'routine_behavior',
-            'insight': 'Morning demand pattern suggests established routine and expectation of morning care',
-            'recommendation': 'Maintain consistent morning routine to reduce anxiety and demanding behavior'
-        })
-
-    if 'evening_social_pattern' in context_types:
-        insights.append({
-            'category': 'social_bonding',
-            'insight': 'Evening social pattern indicates desire for companionship and bonding time',
-            'recommendation': 'Dedicate evening time for interactive play and social bonding activities'
-        })
+    context_types = {c['context'] for c in contextual_indicators}
+    insights.extend(insight for context, insight in CONTEXT_INSIGHTS.items()
+                    if context in context_types)
 
     # Health-based insights
     health_concerns = [h['category']
@@ -423,320 +808,345 @@ def generate_behavioral_insights(interpretation, vocal_patterns, contextual_indi
 
     # Combined pattern insights
     if len(vocal_patterns) >= 3:
-        insights.append({
-            'category': 'complex_communication',
-            'insight': 'Multiple vocal patterns detected - cat is using sophisticated communication strategies',
-            'recommendation': 'Cat is highly communicative - pay attention to subtle vocal cues and respond appropriately'
-        })
+        insights.append(COMPLEX_COMMUNICATION_INSIGHT)
 
     # Confidence-based insights
     if interpretation.get('confidence') == 'Very High':
-        insights.append({
-            'category': 'analysis_reliability',
-            'insight': 'High confidence analysis - vocal patterns are clear and interpretable',
-            'recommendation': 'Analysis results are highly reliable - act on recommendations with confidence'
-        })
-    elif interpretation.get('confidence') in ['Low', 'Very Low']:
-        insights.append({
-            'category': 'analysis_uncertainty',
-            'insight': 'Lower confidence analysis - vocal patterns may be ambiguous or unusual',
-            'recommendation': 'Consider additional context and observe other behavioral cues for complete understanding'
-        })
+        insights.append(HIGH_CONFIDENCE_INSIGHT)
+    elif interpretation.get('confidence') in ('Low', 'Very Low'):
+        insights.append(LOW_CONFIDENCE_INSIGHT)
 
     return insights
 
 
-def interpret_meow(duration, avg_pitch, pitch_variation, avg_loudness,
+# Label tables for the integer codes returned by _classify_meow
+URGENCY_LEVELS = ("Very Low", "Low", "Medium", "High", "Very High")
+CONFIDENCE_LEVELS = ("Very Low", "Low", "Medium", "High", "Very High")
+
+(URGENT_ANXIOUS, SEEKING_ATTENTION, SOCIAL_FRIENDLY, SERIOUS_FORMAL,
+ SERIOUS_COMPLAINING, PLAYFUL_EXPRESSIVE, EXPRESSIVE_ENGAGING, CALM_CONTROLLED,
+ SUBDUED_CALM, ALERT_EXCITED, ALERT_HEALTHY, RELAXED_CONTENT,
+ DISTRESSED_UNWELL, STRESSED_STRAINED) = range(14)
+
+EMOTIONAL_STATES = (
+    "Urgent/Anxious", "Seeking attention/affection", "Social/Friendly",
+    "Serious/Formal", "Serious/Complaining", "Playful/Expressive",
+    "Expressive/Engaging", "Calm/Controlled", "Subdued/Calm", "Alert/Excited",
+    "Alert/Healthy", "Relaxed/Content", "Distressed/Unwell", "Stressed/Strained"
+)
+
+(URGENT_DEMAND, FRIENDLY_REQUEST, NORMAL_SOCIAL, SERIOUS_REQUEST,
+ STRONG_COMPLAINT, INSISTENT_DEMAND, CONFIDENT_REQUEST, POLITE_REQUEST,
+ TENTATIVE_GREETING, HEALTH_ISSUE, STRESSED_REQUEST,
+ STRESSED_COMMUNICATION) = range(12)
+
+PRIMARY_MEANINGS = (
+    "Urgent demand for attention or resources",
+    "Friendly request for attention or interaction",
+    "Normal social communication",
+    "Serious request or mild complaint",
+    "Strong complaint or territorial assertion",
+    "Insistent demand for attention",
+    "Confident request or announcement",
+    "Polite request or gentle greeting",
+    "Tentative greeting or weak vocalization",
+    "Possible health issue or extreme distress",
+    "Stressed vocalization with underlying request",
+    "Stressed communication attempt"
+)
+
+# Detail sentences per feature, indexed by the bucket _classify_meow returns
+# (lowest bucket first)
+DURATION_DETAILS = (
+    "Very short meow ({:.2f}s) - Quick acknowledgment, chirp-like greeting, or attention check. Often used when cat wants to announce presence without being demanding.",
+    "Short meow ({:.2f}s) - Standard greeting, acknowledgment, or polite request. Classic 'hello' or 'please' vocalization commonly used in human-cat interaction.",
+    "Medium meow ({:.2f}s) - Deliberate communication with clear intent. Cat is making effort to convey specific message or request.",
+    "Long meow ({:.2f}s) - Emphatic communication indicating strong desire, complaint, or urgent need. Cat is being persistent and expressive.",
+    "Very long meow ({:.2f}s) - Intense vocalization suggesting distress, strong complaint, or medical issue. Unusual duration may indicate discomfort.",
+)
+
+PITCH_DETAILS = (
+    "Low pitch ({:.0f}Hz) - Deep, adult-like vocalization indicating strong emotion. May suggest complaint, territorial assertion, or physical discomfort. Uncommon in human-directed communication.",
+    "Medium-low pitch ({:.0f}Hz) - More serious communication tone. Cat may be expressing dissatisfaction, making formal request, or indicating mild stress.",
+    "Medium-high pitch ({:.0f}Hz) - Balanced communication frequency indicating normal social interaction. Cat is comfortable and engaging in routine communication.",
+    "High pitch ({:.0f}Hz) - Attention-seeking vocalization with friendly intent. Cat is using appealing frequency to engage human interaction. Indicates positive social motivation.",
+    "Very high pitch ({:.0f}Hz) - Kitten-like vocalization designed to trigger nurturing response. Often indicates urgent need for food, attention, or comfort. May suggest anxiety or excitement.",
+)
+
+PITCH_VARIATION_DETAILS = (
+    "Very low pitch variation ({:.0f}Hz range) - Monotone vocalization with little emotional inflection. May indicate resignation, illness, or very calm state.",
+    "Low pitch variation ({:.0f}Hz range) - Stable, controlled vocalization with minimal inflection. Cat is communicating in calm, measured manner.",
+    "Moderate pitch variation ({:.0f}Hz range) - Some vocal expression with controlled modulation. Balanced between monotone and highly expressive.",
+    "High pitch variation ({:.0f}Hz range) - Expressive meow with emotional inflection. Cat is actively modulating voice to enhance communication effectiveness.",
+    "Very high pitch variation ({:.0f}Hz range) - Highly expressive, melodic meow with complex emotional content. Cat is using sophisticated vocal modulation to convey nuanced message.",
+)
+
+LOUDNESS_DETAILS = (
+    "Very quiet meow (amplitude: {:.3f}) - Whisper-like vocalization indicating timidity, illness, or very gentle approach. May suggest cat is being cautious.",
+    "Quiet meow (amplitude: {:.3f}) - Gentle, polite vocalization showing respect for environment. Cat is being considerate or may be uncertain.",
+    "Moderate volume meow (amplitude: {:.3f}) - Standard communication volume indicating normal comfort level and social engagement.",
+    "Loud meow (amplitude: {:.3f}) - Clear, assertive communication with confident delivery. Cat expects response and is comfortable making presence known.",
+    "Very loud meow (amplitude: {:.3f}) - Demanding, assertive vocalization designed to ensure attention. Cat is being insistent and may be frustrated or very motivated.",
+)
+
+SPECTRAL_CENTROID_DETAILS = (
+    "Very mellow, deep voice quality ({:.0f}Hz centroid) - Unusually soft or muffled vocal quality. May indicate extreme relaxation, illness, or respiratory issues.",
+    "Mellow voice quality ({:.0f}Hz centroid) - Soft, warm vocal tone suggesting contentment and relaxation. Often heard in comfortable, secure cats.",
+    "Balanced voice quality ({:.0f}Hz centroid) - Well-rounded vocal tone with good harmonic content. Indicates relaxed, comfortable vocalization.",
+    "Bright, clear voice quality ({:.0f}Hz centroid) - Crisp, well-defined vocalization indicating alertness and good vocal health. Typical of engaged, healthy cats.",
+    "Very bright, sharp voice quality ({:.0f}Hz centroid) - Piercing, attention-grabbing vocal quality often associated with excitement, alarm, or urgent needs.",
+)
+
+ZCR_DETAILS = (
+    "Smooth voice texture (ZCR: {:.3f}) - Clean, clear vocal production indicating good respiratory health and relaxed vocalization.",
+    "Slightly rough voice texture (ZCR: {:.3f}) - Minor vocal roughness within normal range. May indicate mild excitement or normal vocal variation.",
+    "Rough voice texture (ZCR: {:.3f}) - Noticeable vocal roughness indicating stress, aging, or mild respiratory issues. Monitor for other symptoms.",
+    "Very rough, raspy voice texture (ZCR: {:.3f}) - Significant vocal roughness suggesting possible respiratory distress, illness, or extreme emotional state. Veterinary attention may be needed.",
+)
+
+LOUDNESS_VARIATION_DETAILS = (
+    "Stable volume (σ: {:.3f}) - Consistent loudness throughout vocalization, suggesting controlled, deliberate communication.",
+    None,
+    "High volume variation (σ: {:.3f}) - Dynamic volume changes throughout meow, indicating emotional emphasis or uncertainty.",
+)
+
+@njit(cache=True)
+def _classify_meow(duration, avg_pitch, pitch_variation, avg_loudness,
                    loudness_variation, spectral_centroid, zcr):
     """
-    Advanced interpretation of cat meow with detailed vocal characteristics and contextual analysis
-    """
-    interpretation = {
-        'primary_meaning': '',
-        'emotional_state': '',
-        'urgency_level': '',
-        'confidence': '',
-        'details': [],
-        'vocal_patterns': [],
-        'contextual_indicators': [],
-        'health_indicators': [],
-        'behavioral_insights': [],
-        'acoustic_metrics': {
-            'duration_ms': round(duration * 1000, 1),
-            'pitch_hz': round(avg_pitch, 1),
-            'pitch_variation_hz': round(pitch_variation, 1),
-            'loudness_db': round(avg_loudness, 3),
-            'loudness_variation': round(loudness_variation, 3),
-            'spectral_centroid_hz': round(spectral_centroid, 1),
-            'zero_crossing_rate': round(zcr, 3)
-        }
-    }
+    Numeric core of interpret_meow: map the seven acoustic features to
+    integer codes only (no strings), so it can be compiled with numba.
 
-    # Advanced Vocal Pattern Detection
-    vocal_patterns = detect_vocal_patterns(duration, avg_pitch, pitch_variation,
-                                           avg_loudness, loudness_variation,
-                                           spectral_centroid, zcr)
-    interpretation['vocal_patterns'] = vocal_patterns
-
-    # Contextual Analysis
-    contextual_indicators = analyze_contextual_indicators(duration, avg_pitch, pitch_variation,
-                                                          avg_loudness, loudness_variation,
-                                                          spectral_centroid, zcr)
-    interpretation['contextual_indicators'] = contextual_indicators
-
-    # Health Assessment
-    health_indicators = generate_health_indicators(duration, avg_pitch, pitch_variation,
-                                                   avg_loudness, loudness_variation,
-                                                   spectral_centroid, zcr)
-    interpretation['health_indicators'] = health_indicators
-
-    # Enhanced Duration analysis with behavioral context
+    Returns (duration, pitch, pitch variation, loudness, spectral centroid,
+    zcr, loudness variation) buckets, followed by emotional state, primary
+    meaning, urgency and confidence codes.
+    """
+    # Duration - also sets the baseline urgency
     if duration < 0.3:
-        interpretation['details'].append(
-            f"Very short meow ({duration:.2f}s) - Quick acknowledgment, chirp-like greeting, or attention check. Often used when cat wants to announce presence without being demanding.")
-        urgency_base = "Very Low"
-        duration_category = "chirp"
+        duration_level = 0
     elif duration < 0.8:
-        interpretation['details'].append(
-            f"Short meow ({duration:.2f}s) - Standard greeting, acknowledgment, or polite request. Classic 'hello' or 'please' vocalization commonly used in human-cat interaction.")
-        urgency_base = "Low"
-        duration_category = "greeting"
+        duration_level = 1
     elif duration < 1.5:
-        interpretation['details'].append(
-            f"Medium meow ({duration:.2f}s) - Deliberate communication with clear intent. Cat is making effort to convey specific message or request.")
-        urgency_base = "Medium"
-        duration_category = "communication"
+        duration_level = 2
     elif duration < 3.0:
-        interpretation['details'].append(
-            f"Long meow ({duration:.2f}s) - Emphatic communication indicating strong desire, complaint, or urgent need. Cat is being persistent and expressive.")
-        urgency_base = "High"
-        duration_category = "complaint"
+        duration_level = 3
     else:
-        interpretation['details'].append(
-            f"Very long meow ({duration:.2f}s) - Intense vocalization suggesting distress, strong complaint, or medical issue. Unusual duration may indicate discomfort.")
-        urgency_base = "Very High"
-        duration_category = "distress"
+        duration_level = 4
+    urgency_base = duration_level
 
-    # Enhanced Pitch analysis with frequency ranges
+    # Pitch
     if avg_pitch > 600:
-        interpretation['details'].append(
-            f"Very high pitch ({avg_pitch:.0f}Hz) - Kitten-like vocalization designed to trigger nurturing response. Often indicates urgent need for food, attention, or comfort. May suggest anxiety or excitement.")
-        emotional_state = "Urgent/Anxious"
-        interpretation['primary_meaning'] = "Urgent demand for attention or resources"
-        pitch_category = "kitten-like"
+        pitch_level = 4
+        emotion = URGENT_ANXIOUS
+        meaning = URGENT_DEMAND
     elif avg_pitch > 400:
-        interpretation['details'].append(
-            f"High pitch ({avg_pitch:.0f}Hz) - Attention-seeking vocalization with friendly intent. Cat is using appealing frequency to engage human interaction. Indicates positive social motivation.")
-        emotional_state = "Seeking attention/affection"
-        interpretation['primary_meaning'] = "Friendly request for attention or interaction"
-        pitch_category = "attention-seeking"
+        pitch_level = 3
+        emotion = SEEKING_ATTENTION
+        meaning = FRIENDLY_REQUEST
     elif avg_pitch > 250:
-        interpretation['details'].append(
-            f"Medium-high pitch ({avg_pitch:.0f}Hz) - Balanced communication frequency indicating normal social interaction. Cat is comfortable and engaging in routine communication.")
-        emotional_state = "Social/Friendly"
-        interpretation['primary_meaning'] = "Normal social communication"
-        pitch_category = "social"
+        pitch_level = 2
+        emotion = SOCIAL_FRIENDLY
+        meaning = NORMAL_SOCIAL
     elif avg_pitch > 150:
-        interpretation['details'].append(
-            f"Medium-low pitch ({avg_pitch:.0f}Hz) - More serious communication tone. Cat may be expressing dissatisfaction, making formal request, or indicating mild stress.")
-        emotional_state = "Serious/Formal"
-        interpretation['primary_meaning'] = "Serious request or mild complaint"
-        pitch_category = "formal"
+        pitch_level = 1
+        emotion = SERIOUS_FORMAL
+        meaning = SERIOUS_REQUEST
     else:
-        interpretation['details'].append(
-            f"Low pitch ({avg_pitch:.0f}Hz) - Deep, adult-like vocalization indicating strong emotion. May suggest complaint, territorial assertion, or physical discomfort. Uncommon in human-directed communication.")
-        emotional_state = "Serious/Complaining"
-        interpretation['primary_meaning'] = "Strong complaint or territorial assertion"
-        pitch_category = "complaint"
+        pitch_level = 0
+        emotion = SERIOUS_COMPLAINING
+        meaning = STRONG_COMPLAINT
 
-    # Enhanced Pitch variation analysis
+    # Pitch variation
     if pitch_variation > 100:
-        interpretation['details'].append(
-            f"Very high pitch variation ({pitch_variation:.0f}Hz range) - Highly expressive, melodic meow with complex emotional content. Cat is using sophisticated vocal modulation to convey nuanced message.")
-        expressiveness = "highly_expressive"
-        if emotional_state in ["Social/Friendly", "Seeking attention/affection"]:
-            emotional_state = "Playful/Expressive"
+        pitch_variation_level = 4
+        if emotion == SOCIAL_FRIENDLY or emotion == SEEKING_ATTENTION:
+            emotion = PLAYFUL_EXPRESSIVE
     elif pitch_variation > 50:
-        interpretation['details'].append(
-            f"High pitch variation ({pitch_variation:.0f}Hz range) - Expressive meow with emotional inflection. Cat is actively modulating voice to enhance communication effectiveness.")
-        expressiveness = "expressive"
-        if emotional_state == "Social/Friendly":
-            emotional_state = "Expressive/Engaging"
+        pitch_variation_level = 3
+        if emotion == SOCIAL_FRIENDLY:
+            emotion = EXPRESSIVE_ENGAGING
     elif pitch_variation > 25:
-        interpretation['details'].append(
-            f"Moderate pitch variation ({pitch_variation:.0f}Hz range) - Some vocal expression with controlled modulation. Balanced between monotone and highly expressive.")
-        expressiveness = "moderate"
+        pitch_variation_level = 2
     elif pitch_variation > 10:
-        interpretation['details'].append(
-            f"Low pitch variation ({pitch_variation:.0f}Hz range) - Stable, controlled vocalization with minimal inflection. Cat is communicating in calm, measured manner.")
-        expressiveness = "controlled"
-        if emotional_state == "Social/Friendly":
-            emotional_state = "Calm/Controlled"
+        pitch_variation_level = 1
+        if emotion == SOCIAL_FRIENDLY:
+            emotion = CALM_CONTROLLED
     else:
-        interpretation['details'].append(
-            f"Very low pitch variation ({pitch_variation:.0f}Hz range) - Monotone vocalization with little emotional inflection. May indicate resignation, illness, or very calm state.")
-        expressiveness = "monotone"
-        if emotional_state == "Social/Friendly":
-            emotional_state = "Subdued/Calm"
-
-    # Enhanced Loudness analysis with decibel context
-    # Convert to approximate dB
-    loudness_db = 20 * np.log10(avg_loudness + 1e-10)
+        pitch_variation_level = 0
+        if emotion == SOCIAL_FRIENDLY:
+            emotion = SUBDUED_CALM
+
+    # Loudness - sets the final urgency
     if avg_loudness > 0.15:
-        interpretation['details'].append(
-            f"Very loud meow (amplitude: {avg_loudness:.3f}) - Demanding, assertive vocalization designed to ensure attention. Cat is being insistent and may be frustrated or very motivated.")
-        urgency_level = "Very High"
-        volume_category = "demanding"
-        if interpretation['primary_meaning'] in ["Normal social communication", "Friendly request for attention or interaction"]:
-            interpretation['primary_meaning'] = "Insistent demand for attention"
+        loudness_level = 4
+        urgency = 4
+        if meaning == NORMAL_SOCIAL or meaning == FRIENDLY_REQUEST:
+            meaning = INSISTENT_DEMAND
     elif avg_loudness > 0.08:
-        interpretation['details'].append(
-            f"Loud meow (amplitude: {avg_loudness:.3f}) - Clear, assertive communication with confident delivery. Cat expects response and is comfortable making presence known.")
-        urgency_level = "High"
-        volume_category = "assertive"
-        if interpretation['primary_meaning'] == "Normal social communication":
-            interpretation['primary_meaning'] = "Confident request or announcement"
+        loudness_level = 3
+        urgency = 3
+        if meaning == NORMAL_SOCIAL:
+            meaning = CONFIDENT_REQUEST
     elif avg_loudness > 0.04:
-        interpretation['details'].append(
-            f"Moderate volume meow (amplitude: {avg_loudness:.3f}) - Standard communication volume indicating normal comfort level and social engagement.")
-        urgency_level = urgency_base
-        volume_category = "normal"
+        loudness_level = 2
+        urgency = urgency_base
     elif avg_loudness > 0.02:
-        interpretation['details'].append(
-            f"Quiet meow (amplitude: {avg_loudness:.3f}) - Gentle, polite vocalization showing respect for environment. Cat is being considerate or may be uncertain.")
-        urgency_level = "Low"
-        volume_category = "gentle"
-        if interpretation['primary_meaning'] in ["Confident request or announcement", "Normal social communication"]:
-            interpretation['primary_meaning'] = "Polite request or gentle greeting"
+        loudness_level = 1
+        urgency = 1
+        if meaning == CONFIDENT_REQUEST or meaning == NORMAL_SOCIAL:
+            meaning = POLITE_REQUEST
     else:
-        interpretation['details'].append(
-            f"Very quiet meow (amplitude: {avg_loudness:.3f}) - Whisper-like vocalization indicating timidity, illness, or very gentle approach. May suggest cat is being cautious.")
-        urgency_level = "Very Low"
-        volume_category = "whisper"
-        if interpretation['primary_meaning'] == "Normal social communication":
-            interpretation['primary_meaning'] = "Tentative greeting or weak vocalization"
-
-    # Enhanced Spectral centroid analysis (voice quality)
+        loudness_level = 0
+        urgency = 0
+        if meaning == NORMAL_SOCIAL:
+            meaning = TENTATIVE_GREETING
+
+    # Spectral centroid (voice quality)
     if spectral_centroid > 4000:
-        interpretation['details'].append(
-            f"Very bright, sharp voice quality ({spectral_centroid:.0f}Hz centroid) - Piercing, attention-grabbing vocal quality often associated with excitement, alarm, or urgent needs.")
-        voice_quality = "piercing"
-        if emotional_state in ["Social/Friendly", "Calm/Controlled"]:
-            emotional_state = "Alert/Excited"
+        centroid_level = 4
+        if emotion == SOCIAL_FRIENDLY or emotion == CALM_CONTROLLED:
+            emotion = ALERT_EXCITED
     elif spectral_centroid > 2500:
-        interpretation['details'].append(
-            f"Bright, clear voice quality ({spectral_centroid:.0f}Hz centroid) - Crisp, well-defined vocalization indicating alertness and good vocal health. Typical of engaged, healthy cats.")
-        voice_quality = "bright"
-        if emotional_state == "Subdued/Calm":
-            emotional_state = "Alert/Healthy"
+        centroid_level = 3
+        if emotion == SUBDUED_CALM:
+            emotion = ALERT_HEALTHY
     elif spectral_centroid > 1800:
-        interpretation['details'].append(
-            f"Balanced voice quality ({spectral_centroid:.0f}Hz centroid) - Well-rounded vocal tone with good harmonic content. Indicates relaxed, comfortable vocalization.")
-        voice_quality = "balanced"
+        centroid_level = 2
     elif spectral_centroid > 1200:
-        interpretation['details'].append(
-            f"Mellow voice quality ({spectral_centroid:.0f}Hz centroid) - Soft, warm vocal tone suggesting contentment and relaxation. Often heard in comfortable, secure cats.")
-        voice_quality = "mellow"
-        if emotional_state in ["Serious/Formal", "Serious/Complaining"]:
-            emotional_state = "Relaxed/Content"
+        centroid_level = 1
+        if emotion == SERIOUS_FORMAL or emotion == SERIOUS_COMPLAINING:
+            emotion = RELAXED_CONTENT
     else:
-        interpretation['details'].append(
-            f"Very mellow, deep voice quality ({spectral_centroid:.0f}Hz centroid) - Unusually soft or muffled vocal quality. May indicate extreme relaxation, illness, or respiratory issues.")
-        voice_quality = "deep"
+        centroid_level = 0
 
-    # Enhanced Zero crossing rate analysis (vocal roughness)
+    # Zero crossing rate (vocal roughness)
     if zcr > 0.15:
-        interpretation['details'].append(
-            f"Very rough, raspy voice texture (ZCR: {zcr:.3f}) - Significant vocal roughness suggesting possible respiratory distress, illness, or extreme emotional state. Veterinary attention may be needed.")
-        vocal_health = "concerning"
-        emotional_state = "Distressed/Unwell"
-        interpretation['primary_meaning'] = "Possible health issue or extreme distress"
+        zcr_level = 3
+        emotion = DISTRESSED_UNWELL
+        meaning = HEALTH_ISSUE
     elif zcr > 0.08:
-        interpretation['details'].append(
-            f"Rough voice texture (ZCR: {zcr:.3f}) - Noticeable vocal roughness indicating stress, aging, or mild respiratory issues. Monitor for other symptoms.")
-        vocal_health = "rough"
-        if emotional_state not in ["Distressed/Unwell"]:
-            emotional_state = "Stressed/Strained"
-            # Update primary meaning to be consistent with stressed state
-            if "Friendly request" in interpretation['primary_meaning']:
-                interpretation['primary_meaning'] = "Stressed vocalization with underlying request"
-            elif "Normal social communication" in interpretation['primary_meaning']:
-                interpretation['primary_meaning'] = "Stressed communication attempt"
+        zcr_level = 2
+        emotion = STRESSED_STRAINED
+        # Keep primary meaning consistent with the stressed state
+        if meaning == FRIENDLY_REQUEST:
+            meaning = STRESSED_REQUEST
+        elif meaning == NORMAL_SOCIAL:
+            meaning = STRESSED_COMMUNICATION
     elif zcr > 0.04:
-        interpretation['details'].append(
-            f"Slightly rough voice texture (ZCR: {zcr:.3f}) - Minor vocal roughness within normal range. May indicate mild excitement or normal vocal variation.")
-        vocal_health = "normal_rough"
+        zcr_level = 1
     else:
-        interpretation['details'].append(
-            f"Smooth voice texture (ZCR: {zcr:.3f}) - Clean, clear vocal production indicating good respiratory health and relaxed vocalization.")
-        vocal_health = "smooth"
+        zcr_level = 0
 
-    # Loudness variation analysis
+    # Loudness variation (1 = unremarkable, no detail sentence)
     if loudness_variation > 0.05:
-        interpretation['details'].append(
-            f"High volume variation (σ: {loudness_variation:.3f}) - Dynamic volume changes throughout meow, indicating emotional emphasis or uncertainty.")
+        loudness_variation_level = 2
     elif loudness_variation < 0.02:
-        interpretation['details'].append(
-            f"Stable volume (σ: {loudness_variation:.3f}) - Consistent loudness throughout vocalization, suggesting controlled, deliberate communication.")
+        loudness_variation_level = 0
+    else:
+        loudness_variation_level = 1
+
+    # Enhanced confidence scoring with multiple factors, summed as weighted
+    # flags rather than a chain of branches
+    pitch_ok = int(100 < avg_pitch < 800)  # Reasonable cat vocal range
+    duration_ok = int(0.1 < duration < 5.0)  # Reasonable meow duration
+    centroid_ok = int(500 < spectral_centroid < 6000)  # Reasonable spectral range
+
+    confidence_score = (
+        20 * pitch_ok + 15 * duration_ok + 15 * centroid_ok
+        # Feature consistency - every feature yields a detail (6 or 7 in
+        # total), so this always earns the full >= 5 details bonus
+        + 20
+        # Urgency level determination confidence
+        + 10 + 5 * int(urgency == 4 or urgency == 3 or urgency == 0)
+        # Emotional state determination confidence
+        + 15 * int(emotion != SOCIAL_FRIENDLY)
+        # Adjust confidence based on feature count
+        + 10 * int(pitch_ok + duration_ok + centroid_ok >= 3))
+
+    # Level = number of thresholds (30/50/70/85) reached
+    confidence = (int(confidence_score >= 30) + int(confidence_score >= 50)
+                  + int(confidence_score >= 70) + int(confidence_score >= 85))
+
+    return (duration_level, pitch_level, pitch_variation_level, loudness_level,
+            centroid_level, zcr_level, loudness_variation_level,
+            emotion, meaning, urgency, confidence)
+
+
+def interpret_meow(duration, avg_pitch, pitch_variation, avg_loudness,
+                   loudness_variation, spectral_centroid, zcr):
+    """
+    Advanced interpretation of cat meow with detailed vocal characteristics and contextual analysis
+    """
+    # Plain floats, cast once: the features may be numpy float32 scalars
+    # (which json.dump(default=str) would write as strings), the classifier
+    # and the indicator detection must see the very same values, and numba
+    # then compiles a single signature
+    duration, avg_pitch, pitch_variation, avg_loudness, loudness_variation, \
+        spectral_centroid, zcr = map(float, (
+            duration, avg_pitch, pitch_variation, avg_loudness,
+            loudness_variation, spectral_centroid, zcr))
+
+    interpretation = {
+        'primary_meaning': '',
+        'emotional_state': '',
+        'urgency_level': '',
+        'confidence': '',
+        'details': [],
+        'vocal_patterns': [],
+        'contextual_indicators': [],
+        'health_indicators': [],
+        'behavioral_insights': [],
+        'acoustic_metrics': {
+            'duration_ms': round(duration * 1000, 1),
+            'pitch_hz': round(avg_pitch, 1),
+            'pitch_variation_hz': round(pitch_variation, 1),
+            'loudness_db': round(avg_loudness, 3),
+            'loudness_variation': round(loudness_variation, 3),
+            'spectral_centroid_hz': round(spectral_centroid, 1),
+            'zero_crossing_rate': round(zcr, 3)
+        }
+    }
+
+    # Vocal pattern detection, contextual analysis and health assessment
+    vocal_patterns, contextual_indicators, health_indicators = detect_meow_indicators(
+        duration, avg_pitch, pitch_variation, avg_loudness, loudness_variation,
+        spectral_centroid, zcr)
+    # Plain copies of the shared read-only descriptions: the interpretation
+    # is the caller's to modify and must stay picklable/JSON-serializable
+    interpretation['vocal_patterns'] = [dict(p) for p in vocal_patterns]
+    interpretation['contextual_indicators'] = [dict(c) for c in contextual_indicators]
+    interpretation['health_indicators'] = [dict(h) for h in health_indicators]
+
+    # Classify every feature in one compiled pass, then map codes to text
+    (duration_level, pitch_level, pitch_variation_level, loudness_level,
+     centroid_level, zcr_level, loudness_variation_level,
+     emotion, meaning, urgency, confidence) = _classify_meow(
+        duration, avg_pitch, pitch_variation, avg_loudness, loudness_variation,
+        spectral_centroid, zcr)
+
+    details = interpretation['details']
+    details.append(DURATION_DETAILS[duration_level].format(duration))
+    details.append(PITCH_DETAILS[pitch_level].format(avg_pitch))
+    details.append(
+        PITCH_VARIATION_DETAILS[pitch_variation_level].format(pitch_variation))
+    details.append(LOUDNESS_DETAILS[loudness_level].format(avg_loudness))
+    details.append(
+        SPECTRAL_CENTROID_DETAILS[centroid_level].format(spectral_centroid))
+    details.append(ZCR_DETAILS[zcr_level].format(zcr))
+    if LOUDNESS_VARIATION_DETAILS[loudness_variation_level]:
+        details.append(LOUDNESS_VARIATION_DETAILS[loudness_variation_level].format(
+            loudness_variation))
 
     # Final interpretation
-    interpretation['emotional_state'] = emotional_state
-    interpretation['urgency_level'] = urgency_level
-
-    # Enhanced confidence scoring with multiple factors
-    confidence_score = 0
-    feature_count = 0
-
-    # Pitch confidence
-    if 100 < avg_pitch < 800:  # Reasonable cat vocal range
-        confidence_score += 20
-        feature_count += 1
-
-    # Duration confidence
-    if 0.1 < duration < 5.0:  # Reasonable meow duration
-        confidence_score += 15
-        feature_count += 1
-
-    # Spectral centroid confidence
-    if 500 < spectral_centroid < 6000:  # Reasonable spectral range
-        confidence_score += 15
-        feature_count += 1
-
-    # Feature consistency
-    if len(interpretation['details']) >= 5:
-        confidence_score += 20
-    elif len(interpretation['details']) >= 3:
-        confidence_score += 10
-
-    # Urgency level determination confidence
-    if urgency_level in ["Very High", "High", "Very Low"]:
-        confidence_score += 15
-    elif urgency_level in ["Medium", "Low"]:
-        confidence_score += 10
-
-    # Emotional state determination confidence
-    if emotional_state not in ["Social/Friendly", "Neutral"]:
-        confidence_score += 15
-
-    # Adjust confidence based on feature count
-    if feature_count >= 3:
-        confidence_score += 10
-
-    if confidence_score >= 85:
-        interpretation['confidence'] = "Very High"
-    elif confidence_score >= 70:
-        interpretation['confidence'] = "High"
-    elif confidence_score >= 50:
-        interpretation['confidence'] = "Medium"
-    elif confidence_score >= 30:
-        interpretation['confidence'] = "Low"
-    else:
-        interpretation['confidence'] = "Very Low"
+    interpretation['primary_meaning'] = PRIMARY_MEANINGS[meaning]
+    interpretation['emotional_state'] = EMOTIONAL_STATES[emotion]
+    interpretation['urgency_level'] = URGENCY_LEVELS[urgency]
+    interpretation['confidence'] = CONFIDENCE_LEVELS[confidence]
 
     # Generate Comprehensive Behavioral Insights
     behavioral_insights = generate_behavioral_insights(interpretation, vocal_patterns,
                                                        contextual_indicators, health_indicators)
-    interpretation['behavioral_insights'] = behavioral_insights
+    interpretation['behavioral_insights'] = [dict(i) for i in behavioral_insights]
 
     # Enhance details with pattern-specific information
     for pattern in vocal_patterns:
@@ -757,97 +1167,159 @@ def print_analysis_results(interpretation):
     """
     Print the comprehensive meow analysis results in a readable format
     """
-    print("🐱 ADVANCED CAT MEOW ANALYSIS RESULTS 🐱")
-    print("=" * 60)
-    print(f"Primary Meaning: {interpretation['primary_meaning']}")
-    print(f"Emotional State: {interpretation['emotional_state']}")
-    print(f"Urgency Level: {interpretation['urgency_level']}")
-    print(f"Analysis Confidence: {interpretation['confidence']}")
+    # Collected and written with a single print (one stdout write per report)
+    lines = [
+        "🐱 ADVANCED CAT MEOW ANALYSIS RESULTS 🐱",
+        "=" * 60,
+        f"Primary Meaning: {interpretation['primary_meaning']}",
+        f"Emotional State: {interpretation['emotional_state']}",
+        f"Urgency Level: {interpretation['urgency_level']}",
+        f"Analysis Confidence: {interpretation['confidence']}",
+    ]
+    add = lines.append
 
     # Acoustic Metrics
-    if 'acoustic_metrics' in interpretation:
-        print(f"\n🔬 ACOUSTIC METRICS:")
-        metrics = interpretation['acoustic_metrics']
-        print(f"  Duration: {metrics['duration_ms']} ms")
-        print(f"  Pitch: {metrics['pitch_hz']} Hz")
-        print(f"  Pitch Variation: {metrics['pitch_variation_hz']} Hz")
-        print(f"  Loudness: {metrics['loudness_db']}")
-        print(f"  Spectral Centroid: {metrics['spectral_centroid_hz']} Hz")
-        print(f"  Zero Crossing Rate: {metrics['zero_crossing_rate']}")
+    metrics = interpretation.get('acoustic_metrics')
+    if metrics is not None:
+        add("\n🔬 ACOUSTIC METRICS:")
+        add(f"  Duration: {metrics['duration_ms']} ms")
+        add(f"  Pitch: {metrics['pitch_hz']} Hz")
+        add(f"  Pitch Variation: {metrics['pitch_variation_hz']} Hz")
+        add(f"  Loudness: {metrics['loudness_db']}")
+        add(f"  Spectral Centroid: {metrics['spectral_centroid_hz']} Hz")
+        add(f"  Zero Crossing Rate: {metrics['zero_crossing_rate']}")
 
     # Vocal Patterns
-    if interpretation.get('vocal_patterns'):
-        print(f"\n🎵 VOCAL PATTERNS DETECTED:")
-        for pattern in interpretation['vocal_patterns']:
-            print(
-                f"  • {pattern['pattern'].replace('_', ' ').title()}: {pattern['description']}")
-            print(f"    Behavioral Meaning: {pattern['behavioral_meaning']}")
-            print(f"    Confidence: {pattern['confidence']}")
+    vocal_patterns = interpretation.get('vocal_patterns')
+    if vocal_patterns:
+        add("\n🎵 VOCAL PATTERNS DETECTED:")
+        for pattern in vocal_patterns:
+            add(f"  • {pattern['pattern'].replace('_', ' ').title()}: {pattern['description']}")
+            add(f"    Behavioral Meaning: {pattern['behavioral_meaning']}")
+            add(f"    Confidence: {pattern['confidence']}")
 
     # Contextual Indicators
-    if interpretation.get('contextual_indicators'):
-        print(f"\n⏰ CONTEXTUAL ANALYSIS:")
-        for indicator in interpretation['contextual_indicators']:
-            print(
-                f"  • {indicator['context'].replace('_', ' ').title()}: {indicator['description']}")
+    contextual_indicators = interpretation.get('contextual_indicators')
+    if contextual_indicators:
+        add("\n⏰ CONTEXTUAL ANALYSIS:")
+        for indicator in contextual_indicators:
+            add(f"  • {indicator['context'].replace('_', ' ').title()}: {indicator['description']}")
             if 'likely_timing' in indicator:
-                print(f"    Likely Timing: {indicator['likely_timing']}")
+                add(f"    Likely Timing: {indicator['likely_timing']}")
             if 'behavioral_context' in indicator:
-                print(f"    Context: {indicator['behavioral_context']}")
+                add(f"    Context: {indicator['behavioral_context']}")
 
     # Health Indicators
-    if interpretation.get('health_indicators'):
-        print(f"\n🏥 HEALTH ASSESSMENT:")
-        for health in interpretation['health_indicators']:
-            severity_emoji = "🔴" if health['severity'] == 'High' else "🟡" if health['severity'] == 'Medium' else "🟢"
-            print(
-                f"  {severity_emoji} {health['category'].replace('_', ' ').title()} ({health['severity']} Priority)")
-            print(f"    {health['description']}")
-            print(f"    Recommendation: {health['recommendation']}")
+    health_indicators = interpretation.get('health_indicators')
+    if health_indicators:
+        add("\n🏥 HEALTH ASSESSMENT:")
+        for health in health_indicators:
+            severity = health['severity']
+            severity_emoji = "🔴" if severity == 'High' else "🟡" if severity == 'Medium' else "🟢"
+            add(f"  {severity_emoji} {health['category'].replace('_', ' ').title()} ({severity} Priority)")
+            add(f"    {health['description']}")
+            add(f"    Recommendation: {health['recommendation']}")
 
     # Behavioral Insights
-    if interpretation.get('behavioral_insights'):
-        print(f"\n🧠 BEHAVIORAL INSIGHTS:")
-        for insight in interpretation['behavioral_insights']:
-            print(
-                f"  • {insight['category'].replace('_', ' ').title()}: {insight['insight']}")
-            print(f"    💡 Recommendation: {insight['recommendation']}")
+    behavioral_insights = interpretation.get('behavioral_insights')
+    if behavioral_insights:
+        add("\n🧠 BEHAVIORAL INSIGHTS:")
+        for insight in behavioral_insights:
+            add(f"  • {insight['category'].replace('_', ' ').title()}: {insight['insight']}")
+            add(f"    💡 Recommendation: {insight['recommendation']}")
+
+    add("\nDetailed Analysis:")
+    lines.extend(f"• {detail}" for detail in interpretation['details'])
+
+    add("\n" + "=" * 60)
+    add("Note: This analysis combines acoustic science with feline behavioral research.")
+    add("Individual cats may have unique vocal characteristics and personal communication styles.")
+    add("For health concerns, consult with a veterinarian for professional assessment.")
 
-    print("\nDetailed Analysis:")
-    for detail in interpretation['details']:
-        print(f"• {detail}")
+    print("\n".join(lines))
 
-    print("\n" + "=" * 60)
-    print("Note: This analysis combines acoustic science with feline behavioral research.")
-    print("Individual cats may have unique vocal characteristics and personal communication styles.")
-    print("For health concerns, consult with a veterinarian for professional assessment.")
+
+def _process(file_path, generate_plot=False):
+    """
+    Analyze one file in a worker process, returning the error instead of raising
+    """
+    try:
+        return file_path, analyze_cat_meow(file_path, generate_plot=generate_plot)
+    except Exception as e:
+        return file_path, e
+
+
+def find_audio_files(folder='.'):
+    """
+    Sorted paths of the recordings in folder (one scandir pass - entries carry
+    their file type, so no extra stat calls)
+    """
+    with os.scandir(folder) as entries:
+        return sorted(os.path.normpath(entry.path) for entry in entries
+                      if entry.is_file()
+                      and entry.name.lower().endswith(AUDIO_EXTENSIONS))
+
+
+def analyze_files(file_paths, generate_plot=False):
+    """
+    Analyze recordings in parallel worker processes, one per CPU at most.
+
+    Yields (file_path, interpretation) pairs in completion order; a file that
+    failed yields its exception instead of an interpretation.
+    """
+    if not file_paths:
+        return
+    processes = min(os.cpu_count() or 1, len(file_paths))
+    # The workers only analyze recordings, so they can switch to pyFFTW
+    with multiprocessing.Pool(processes=processes, initializer=enable_pyfftw) as pool:
+        yield from pool.imap_unordered(
+            functools.partial(_process, generate_plot=generate_plot), file_paths)
+
+
+def analyze_folder(folder='.', generate_plot=False):
+    """
+    Analyze every recording in folder (see analyze_files)
+    """
+    return analyze_files(find_audio_files(folder), generate_plot=generate_plot)
 
 
 if __name__ == "__main__":
-    # Automatically find all .m4a files in the current directory
-    meow_files = glob.glob("*.m4a")
-    meow_files.sort()  # Sort files alphabetically for consistent ordering
+    parser = argparse.ArgumentParser(
+        description="Analyze all cat meow recordings in a folder")
+    parser.add_argument("folder", nargs="?", default=".",
+                        help="folder with the recordings (default: current directory)")
+    parser.add_argument("--plot", action="store_true",
+                        help="also save a meow_analysis_<name>.png graph per recording")
+    args = parser.parse_args()
+    if not os.path.isdir(args.folder):
+        parser.error(f"{args.folder} is not a folder")
+
+    # Automatically find all audio files in the folder
+    meow_files = find_audio_files(args.folder)
 
     if not meow_files:
-        print("❌ No .m4a files found in the current directory!")
-        print("Please make sure you have .m4a audio files to analyze.")
+        print(f"❌ No audio files found in {os.path.abspath(args.folder)}!")
+        print(f"Please make sure you have {'/'.join(AUDIO_EXTENSIONS)} files to analyze.")
         exit(1)
 
     print("🐱 ANALYZING MULTIPLE CAT MEOWS 🐱")
     print("=" * 50)
-    print(f"Found {len(meow_files)} .m4a file(s): {', '.join(meow_files)}")
+    print(f"Found {len(meow_files)} audio file(s): {', '.join(meow_files)}")
     print("=" * 50)
 
-    for i, file_path in enumerate(meow_files, 1):
+    enable_pyfftw()
+
+    # Each recording is independent, so analyze them in parallel worker processes
+    for i, (file_path, results) in enumerate(
+            analyze_files(meow_files, generate_plot=args.plot), 1):
         print(
             f"\n📁 ANALYZING {file_path.upper()} (Recording {i}/{len(meow_files)})")
         print("-" * 30)
 
-        try:
-            results = analyze_cat_meow(file_path)
-            print_analysis_results(results)
-        except Exception as e:
-            print(f"❌ Error analyzing {file_path}: {e}")
+        if isinstance(results, Exception):
+            print(f"❌ Error analyzing {file_path}: {results}")
             print("Make sure the file exists and librosa is installed")
+        else:
+            print_analysis_results(results)
 
         print("\n" + "=" * 50)
@@ -17,4 +17,19 @@ matplotlib.use('Agg')
 os.environ['MPLBACKEND'] = 'Agg'
 os.environ['DISPLAY'] = ''  # Disable display for headless operation
 
+# Audio is resampled to this rate before meow feature extraction. Cat
+# vocalizations carry almost no energy above ~8 kHz, and this matches the
+# rate audio is extracted from videos at (AnalyzerConfig.AUDIO_SAMPLE_RATE)
+AUDIO_ANALYSIS_SAMPLE_RATE = 22050
+
+# Recordings longer than this (seconds) are analyzed block by block instead
+# of being loaded whole, when no graph is requested and the file is in a
+# format soundfile can stream (wav/flac/ogg)
+STREAM_MIN_DURATION = 120
+
+# Videos whose enhanced analysis has an overall confidence below this get no
+# enhanced visualization (their results are marked as needing verification
+# anyway); 0 draws one for every video
+VISUALIZATION_MIN_CONFIDENCE = 0.4
+
 print("✅ Configured non-interactive matplotlib backend")
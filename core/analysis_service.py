@@ -6,12 +6,15 @@ Separates business logic from web presentation
 
 import os
 import json
-import glob
+import functools
 import shutil
 import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from simple_video_analysis import SimpleCatVideoAnalyzer
+from core.reuse_helpers import CACHE_DIR as MEOW_CACHE_DIR
 
 # Try to import enhanced analyzer
 try:
@@ -21,6 +24,68 @@ except ImportError:
     EnhancedCatVideoAnalyzer = None
     ML_AVAILABLE = False
 
+# orjson is optional - a faster parser for the saved results
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _read_file(json_file):
+    """Read one results file, returning (bytes, error) so a bad file doesn't stop the rest"""
+    try:
+        with open(json_file, 'rb') as f:
+            return f.read(), None
+    except Exception as e:
+        return None, e
+
+
+def _parse_json(raw):
+    """Parse a results file's bytes, with orjson when it's installed"""
+    if ORJSON_AVAILABLE:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # NaN/Infinity (allowed by json.dump) are rejected by orjson
+            pass
+    return json.loads(raw)
+
+
+@functools.lru_cache(maxsize=256)
+def _load_enhanced(raw, default_name):
+    """
+    Parse an enhanced results file and convert it to the regular format,
+    returning (video_name, converted data). Memoized on the file's bytes, so
+    page refreshes skip both steps for files that haven't changed. Callers
+    share the returned dict and must not modify it.
+    """
+    data = _parse_json(raw)
+    return (data.get('video_name', default_name),
+            AnalysisService._convert_enhanced_to_regular_format(data))
+
+
+# Download package compression by extension. Everything else (audio, graphs,
+# video) is stored as is - deflating it costs CPU for a few percent at best
+ZIP_COMPRESSION = {
+    '.json': zipfile.ZIP_DEFLATED,
+    '.txt': zipfile.ZIP_DEFLATED,
+}
+
+
+def _iter_files(folder):
+    """Yield the path of every file below folder (nothing if it's missing)"""
+    try:
+        entries = list(os.scandir(folder))
+    except (FileNotFoundError, NotADirectoryError):
+        return
+    for entry in entries:
+        # Like os.walk, symlinked directories are not followed
+        if entry.is_dir(follow_symlinks=False):
+            yield from _iter_files(entry.path)
+        elif not entry.is_dir():
+            yield entry.path
+
 
 class AnalysisService:
     """Service layer for cat behavior analysis operations"""
@@ -44,15 +109,31 @@ class AnalysisService:
             'current_mode': 'Enhanced ML' if self.use_ml else 'Traditional'
         }
 
-    def cleanup_previous_results(self) -> None:
-        """Remove all previous analysis results"""
+    def cleanup_previous_results(self, clear_cache: bool = False) -> None:
+        """
+        Remove all previous analysis results
+
+        Args:
+            clear_cache: Also drop the memoized meow features and enhanced
+                analyses. They are keyed by file content, code version (and
+                the trained models), so keeping them is safe and lets re-runs
+                over unchanged videos skip the feature and ML analysis.
+        """
         self.analyzer.cleanup_results()
         self.results_cache = {}
 
-    def run_analysis(self) -> Dict[str, Any]:
-        """Run comprehensive analysis and return results"""
+        if clear_cache and os.path.exists(MEOW_CACHE_DIR):
+            shutil.rmtree(MEOW_CACHE_DIR)
+
+    def run_analysis(self, clear_cache: bool = False) -> Dict[str, Any]:
+        """
+        Run comprehensive analysis and return results
+
+        Args:
+            clear_cache: Drop cached analyses first (see cleanup_previous_results)
+        """
         try:
-            self.cleanup_previous_results()
+            self.cleanup_previous_results(clear_cache=clear_cache)
 
             print("🚀 Running Combined Analysis (Traditional + ML)...")
 
@@ -65,8 +146,9 @@ class AnalysisService:
                 print("🧠 Step 2: Running enhanced ML analysis...")
                 video_files = self._get_video_files()
 
-                for video_path in video_files:
-                    result = self.enhanced_analyzer.analyze_video(video_path)
+                # Videos are independent, so they are analyzed in parallel
+                results = self.enhanced_analyzer.analyze_videos(video_files)
+                for video_path, result in zip(video_files, results):
                     if result is None:
                         print("⚠️ Enhanced analysis failed for", video_path)
             else:
@@ -92,35 +174,49 @@ class AnalysisService:
         """Load analysis results from JSON files"""
         self.results_cache = {}
 
-        json_files = glob.glob('combined_analysis_results/*.json')
+        # Separate regular and enhanced analysis files in one directory pass
+        # (hidden files are skipped)
+        regular_files = []
+        enhanced_files = []
+        try:
+            entries = list(os.scandir('combined_analysis_results'))
+        except FileNotFoundError:
+            entries = []
+        for entry in entries:
+            if entry.name.endswith('.json') and not entry.name.startswith('.') and entry.is_file():
+                if 'enhanced_analysis' in entry.name:
+                    enhanced_files.append(entry.path)
+                else:
+                    regular_files.append(entry.path)
 
-        # Separate regular and enhanced analysis files
-        regular_files = [f for f in json_files if 'enhanced_analysis' not in f]
-        enhanced_files = [f for f in json_files if 'enhanced_analysis' in f]
+        # Read every file concurrently (I/O bound), in directory order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            loaded = list(executor.map(_read_file, regular_files + enhanced_files))
 
         # Load regular files first
-        for json_file in regular_files:
+        for json_file, (raw, error) in zip(regular_files, loaded):
+            if error is not None:
+                print(f"Error loading {json_file}: {error}")
+                continue
             try:
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
-                    video_name = data.get('video_name', os.path.splitext(
-                        os.path.basename(json_file))[0])
-                    self.results_cache[video_name] = data
+                data = _parse_json(raw)
+                video_name = data.get('video_name', os.path.splitext(
+                    os.path.basename(json_file))[0])
+                self.results_cache[video_name] = data
             except Exception as e:
                 print(f"Error loading {json_file}: {e}")
 
         # Load enhanced files if no regular file exists for that video
-        for json_file in enhanced_files:
+        for json_file, (raw, error) in zip(enhanced_files, loaded[len(regular_files):]):
+            if error is not None:
+                print(f"Error loading {json_file}: {error}")
+                continue
             try:
-                with open(json_file, 'r') as f:
-                    data = json.load(f)
-                    video_name = data.get('video_name', os.path.splitext(
-                        os.path.basename(json_file))[0])
-
-                    if video_name not in self.results_cache:
-                        converted_data = self._convert_enhanced_to_regular_format(
-                            data)
-                        self.results_cache[video_name] = converted_data
+                video_name, converted_data = _load_enhanced(
+                    raw, os.path.splitext(os.path.basename(json_file))[0])
+
+                if video_name not in self.results_cache:
+                    self.results_cache[video_name] = converted_data
             except Exception as e:
                 print(f"Error loading {json_file}: {e}")
 
@@ -135,7 +231,7 @@ class AnalysisService:
         # Create downloads directory
         os.makedirs('downloads', exist_ok=True)
 
-        with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+        with zipfile.ZipFile(zip_path, 'w', compresslevel=1) as zipf:
             folders_to_include = [
                 'extracted_audio',
                 'audio_analysis_graphs',
@@ -144,12 +240,10 @@ class AnalysisService:
             ]
 
             for folder in folders_to_include:
-                if os.path.exists(folder):
-                    for root, dirs, files in os.walk(folder):
-                        for file in files:
-                            file_path = os.path.join(root, file)
-                            arcname = os.path.relpath(file_path)
-                            zipf.write(file_path, arcname)
+                for file_path in _iter_files(folder):
+                    ext = os.path.splitext(file_path)[1].lower()
+                    zipf.write(file_path, os.path.relpath(file_path),
+                               compress_type=ZIP_COMPRESSION.get(ext, zipfile.ZIP_STORED))
 
         return zip_path
 
@@ -170,38 +264,26 @@ class AnalysisService:
 
         # Overall statistics
         if results:
-            emotions = [r.get('audio_analysis', {}).get('emotional_state', 'Unknown')
-                        for r in results.values()]
-            activities = [r.get('visual_analysis', {}).get('dominant_activity', 'Unknown')
-                          for r in results.values()]
-            urgencies = [r.get('audio_analysis', {}).get('urgency_level', 'Unknown')
-                         for r in results.values()]
-
-            # Count occurrences
-            emotion_counts = {}
-            activity_counts = {}
-            urgency_counts = {}
-
-            for emotion in emotions:
-                emotion_counts[emotion] = emotion_counts.get(emotion, 0) + 1
-            for activity in activities:
-                activity_counts[activity] = activity_counts.get(
-                    activity, 0) + 1
-            for urgency in urgencies:
-                urgency_counts[urgency] = urgency_counts.get(urgency, 0) + 1
-
-            # Most common patterns
-            most_common_emotion = max(
-                emotion_counts, key=emotion_counts.get) if emotion_counts else "Unknown"
-            most_common_activity = max(
-                activity_counts, key=activity_counts.get) if activity_counts else "Unknown"
-            most_common_urgency = max(
-                urgency_counts, key=urgency_counts.get) if urgency_counts else "Unknown"
+            # One pass over the results feeds all three tallies
+            emotions, activities, urgencies = zip(*(
+                (r.get('audio_analysis', {}).get('emotional_state', 'Unknown'),
+                 r.get('visual_analysis', {}).get(
+                     'dominant_activity', 'Unknown'),
+                 r.get('audio_analysis', {}).get('urgency_level', 'Unknown'))
+                for r in results.values()))
+
+            # Most common patterns (ties go to the first one seen)
+            most_common_emotion, emotion_count = Counter(
+                emotions).most_common(1)[0]
+            most_common_activity, activity_count = Counter(
+                activities).most_common(1)[0]
+            most_common_urgency, urgency_count = Counter(
+                urgencies).most_common(1)[0]
 
             report_lines.extend([
-                f"Most Common Emotional State: {most_common_emotion} ({emotion_counts.get(most_common_emotion, 0)} videos)",
-                f"Most Common Activity Level: {most_common_activity} ({activity_counts.get(most_common_activity, 0)} videos)",
-                f"Most Common Urgency Level: {most_common_urgency} ({urgency_counts.get(most_common_urgency, 0)} videos)",
+                f"Most Common Emotional State: {most_common_emotion} ({emotion_count} videos)",
+                f"Most Common Activity Level: {most_common_activity} ({activity_count} videos)",
+                f"Most Common Urgency Level: {most_common_urgency} ({urgency_count} videos)",
                 ""
             ])
 
@@ -217,10 +299,11 @@ class AnalysisService:
             visual = result.get('visual_analysis', {})
             combined = result.get('combined_interpretation', {})
 
+            duration = visual.get('duration', 'Unknown')
             report_lines.extend([
                 f"📹 VIDEO: {video_name}",
-                f"   Duration: {visual.get('duration', 'Unknown'):.1f} seconds" if isinstance(visual.get(
-                    'duration'), (int, float)) else f"   Duration: {visual.get('duration', 'Unknown')}",
+                f"   Duration: {duration:.1f} seconds" if isinstance(
+                    duration, (int, float)) else f"   Duration: {duration}",
                 f"   Timestamp: {result.get('timestamp', 'Unknown')}",
                 "",
                 "   🎵 AUDIO ANALYSIS:",
@@ -245,10 +328,11 @@ class AnalysisService:
                     ""
                 ])
 
-                if combined.get('recommendations'):
+                recommendations = combined.get('recommendations')
+                if recommendations:
                     report_lines.append("   💡 RECOMMENDATIONS:")
-                    for rec in combined.get('recommendations', []):
-                        report_lines.append(f"      • {rec}")
+                    report_lines.extend(
+                        f"      • {rec}" for rec in recommendations)
                     report_lines.append("")
 
             report_lines.append("-" * 50)
@@ -281,7 +365,8 @@ class AnalysisService:
         """Get all video files from input directory"""
         return self.analyzer.get_video_files()
 
-    def _convert_enhanced_to_regular_format(self, enhanced_data: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _convert_enhanced_to_regular_format(enhanced_data: Dict[str, Any]) -> Dict[str, Any]:
         """Convert enhanced analysis format to regular format for template compatibility"""
         try:
             # Extract traditional analysis data
@@ -3,6 +3,7 @@
 Unified audio extraction module supporting multiple methods
 """
 
+import importlib.util
 import os
 import shutil
 import subprocess
@@ -33,11 +34,9 @@ class MoviePyAudioExtractor(AudioExtractor):
     def is_available(self) -> bool:
         """Check if MoviePy is available"""
         if self._moviepy_available is None:
-            try:
-                from moviepy import VideoFileClip
-                self._moviepy_available = True
-            except ImportError:
-                self._moviepy_available = False
+            # Look for the package without importing it: MoviePy pulls in
+            # imageio, proglog and friends, and is only a fallback extractor
+            self._moviepy_available = importlib.util.find_spec('moviepy') is not None
 
         return self._moviepy_available
 
@@ -72,9 +71,18 @@ class MoviePyAudioExtractor(AudioExtractor):
 class FFmpegAudioExtractor(AudioExtractor):
     """Audio extraction using FFmpeg"""
 
+    # Resolved once per process rather than searching PATH for every video
+    _ffmpeg_path: Optional[str] = None
+    _ffmpeg_checked = False
+
     def is_available(self) -> bool:
         """Check if FFmpeg is available"""
-        return shutil.which('ffmpeg') is not None
+        cls = FFmpegAudioExtractor
+        if not cls._ffmpeg_checked:
+            cls._ffmpeg_path = shutil.which('ffmpeg')
+            cls._ffmpeg_checked = True
+
+        return cls._ffmpeg_path is not None
 
     def extract_audio(self, video_path: str, output_path: str) -> bool:
         """Extract audio using FFmpeg"""
@@ -86,22 +94,22 @@ class FFmpegAudioExtractor(AudioExtractor):
         try:
             print(f"🎵 Extracting audio using FFmpeg...")
 
+            # Only errors are reported; progress output is never read
             cmd = [
-                'ffmpeg', '-i', video_path,
+                self._ffmpeg_path, '-loglevel', 'error', '-nostats', '-i', video_path,
                 '-vn', '-acodec', 'pcm_s16le',
                 '-ar', '22050', '-ac', '1',
                 output_path, '-y'
             ]
 
             result = subprocess.run(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
-                universal_newlines=True
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
             )
 
             if result.returncode == 0:
                 return True
             else:
-                print(f"❌ FFmpeg error: {result.stderr}")
+                print(f"❌ FFmpeg error: {result.stderr.decode(errors='replace')}")
                 return False
 
         except Exception as e:
@@ -112,11 +120,25 @@ class FFmpegAudioExtractor(AudioExtractor):
 class UnifiedAudioExtractor:
     """Unified audio extractor that tries multiple methods"""
 
+    # Shared by every instance so availability is probed once per process
+    _extractors = None
+
     def __init__(self):
-        self.extractors = [
-            MoviePyAudioExtractor(),
-            FFmpegAudioExtractor()
-        ]
+        self.extractors = self._get_extractors()
+        self._available_extractors = [extractor for extractor in self.extractors
+                                      if extractor.is_available()]
+
+    @classmethod
+    def _get_extractors(cls) -> list:
+        """Build the extractors, in order of preference, on first use"""
+        if cls._extractors is None:
+            # FFmpeg first: MoviePy runs the same ffmpeg underneath, behind a
+            # heavy import and an extra decode/encode pass, so it is the fallback
+            cls._extractors = [
+                FFmpegAudioExtractor(),
+                MoviePyAudioExtractor()
+            ]
+        return cls._extractors
 
     def extract_audio(self, video_path: str, output_dir: str) -> Optional[str]:
         """
@@ -135,19 +157,17 @@ class UnifiedAudioExtractor:
         print(f"🎵 Extracting audio from {video_path}...")
 
         # Try each extractor until one succeeds
-        for extractor in self.extractors:
-            if extractor.is_available():
-                if extractor.extract_audio(video_path, audio_output):
-                    print(f"✅ Audio extracted to: {audio_output}")
-                    return audio_output
-                else:
-                    print(
-                        f"⚠️ {extractor.__class__.__name__} failed, trying next method...")
+        for extractor in self._available_extractors:
+            if extractor.extract_audio(video_path, audio_output):
+                print(f"✅ Audio extracted to: {audio_output}")
+                return audio_output
+            else:
+                print(
+                    f"⚠️ {extractor.__class__.__name__} failed, trying next method...")
 
         print("❌ All audio extraction methods failed")
         return None
 
     def get_available_methods(self) -> list:
         """Get list of available extraction methods"""
-        return [extractor.__class__.__name__ for extractor in self.extractors
-                if extractor.is_available()]
+        return [extractor.__class__.__name__ for extractor in self._available_extractors]
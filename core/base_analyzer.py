@@ -3,32 +3,132 @@
 Base analyzer class with shared functionality for all cat behavior analyzers
 """
 
+import json
+import math
+import multiprocessing
 import os
 import shutil
 from abc import ABC, abstractmethod
+from concurrent.futures import ProcessPoolExecutor
+from types import MappingProxyType
 from typing import Dict, Optional, List
 from datetime import datetime
 
+import numpy as np
+
+# orjson is optional - a faster writer for analysis results
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def _finite_or_none(value):
+    """Replace NaN and infinities in value with None, as orjson writes them (null)"""
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: _finite_or_none(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_finite_or_none(item) for item in value]
+    return value
+
+
+def _json_default(value):
+    """
+    default= of both writers: numpy scalars and arrays become numbers and
+    lists (the ones orjson can't serialize itself too, e.g. non-contiguous
+    or float16 arrays), anything else str()
+    """
+    if isinstance(value, (np.ndarray, np.generic)):
+        if value.dtype == np.float32:
+            # Shortest digits that round-trip in float32, as orjson writes
+            # them, rather than the float64 expansion tolist() would give
+            value = np.array([float(str(item)) for item in np.ravel(value)],
+                             dtype=object).reshape(np.shape(value))
+        return _finite_or_none(value.tolist())
+    return str(value)
+
+
+def dump_json(data, path: str) -> None:
+    """
+    Write analysis results to path as indented UTF-8 JSON.
+
+    Numpy scalars and arrays are written as numbers and lists, NaN and
+    infinities as null, non-ASCII text (emoji included) unescaped, and
+    anything else (datetimes included) as str(). orjson and the stdlib
+    fallback write the same document, up to whitespace.
+    """
+    if ORJSON_AVAILABLE:
+        try:
+            payload = orjson.dumps(
+                data, default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY
+                | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits - leave those to the stdlib
+            pass
+        else:
+            with open(path, 'wb') as f:
+                f.write(payload)
+            return
+
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(_finite_or_none(data), f, indent=2, ensure_ascii=False,
+                  default=_json_default)
+
+
+# Analyzer owned by each analyze_videos worker process
+_worker_analyzer = None
+
+
+def _init_worker(analyzer_class) -> None:
+    """
+    ProcessPoolExecutor initializer: keep native math libraries to a single
+    thread (the pool already uses every core) and build the worker's analyzer
+    """
+    global _worker_analyzer
+    # For libraries that read these when they first start their thread pool
+    os.environ['OMP_NUM_THREADS'] = '1'
+    os.environ['MKL_NUM_THREADS'] = '1'
+    # ... and for BLAS/OpenMP pools that were already started by the imports
+    try:
+        from threadpoolctl import threadpool_limits
+        threadpool_limits(1)
+    except ImportError:
+        pass
+    _worker_analyzer = analyzer_class()
+
+
+def _analyze_in_worker(job) -> Optional[dict]:
+    """Analyze one (number, total, video_path) job with the worker's analyzer"""
+    return _worker_analyzer.analyze_numbered_video(*job)
+
+
+# Folder structure - single source of truth (read-only, shared by every analyzer)
+FOLDERS = MappingProxyType({
+    'audio': 'extracted_audio',
+    'audio_graphs': 'audio_analysis_graphs',
+    'videos': 'input_videos',
+    'video_results': 'video_analysis_results',
+    'combined_results': 'combined_analysis_results',
+    'ml_results': 'ml_analysis_results',
+    'models': 'ml_models',
+    'features': 'extracted_features',
+    'training_data': 'training_data',
+    'downloads': 'downloads'
+})
+
+# Video file extensions (lowercase; matched case-insensitively)
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.avi', '.mov', '.mkv', '.wmv'})
+
 
 class AnalyzerConfig:
     """Centralized configuration for all analyzers"""
 
-    # Folder structure - single source of truth
-    FOLDERS = {
-        'audio': 'extracted_audio',
-        'audio_graphs': 'audio_analysis_graphs',
-        'videos': 'input_videos',
-        'video_results': 'video_analysis_results',
-        'combined_results': 'combined_analysis_results',
-        'ml_results': 'ml_analysis_results',
-        'models': 'ml_models',
-        'features': 'extracted_features',
-        'training_data': 'training_data',
-        'downloads': 'downloads'
-    }
-
-    # Video file extensions
-    VIDEO_EXTENSIONS = ['.mp4', '.avi', '.mov', '.mkv', '.wmv']
+    FOLDERS = FOLDERS
+    VIDEO_EXTENSIONS = VIDEO_EXTENSIONS
 
     # Audio processing settings
     AUDIO_SAMPLE_RATE = 22050
@@ -49,8 +149,9 @@ class BaseAnalyzer(ABC):
         Args:
             folders_to_create: List of folder keys to create. If None, creates all folders.
         """
-        self.config = AnalyzerConfig()
-        self.folders = self.config.FOLDERS
+        # The settings are class-level constants; there is nothing to instantiate
+        self.config = AnalyzerConfig
+        self.folders = FOLDERS
 
         # Create only specified folders or all if none specified
         folders_to_setup = folders_to_create or list(self.folders.keys())
@@ -58,13 +159,19 @@ class BaseAnalyzer(ABC):
 
     def setup_directories(self, folder_keys: List[str]) -> None:
         """Create organized folder structure"""
+        # Usually everything already exists (and every pool worker builds an
+        # analyzer), so only touch and report the folders that are missing
+        missing = [key for key in folder_keys
+                   if key in self.folders and not os.path.isdir(self.folders[key])]
+        if not missing:
+            return
+
         print("📁 Setting up directory structure...")
 
-        for key in folder_keys:
-            if key in self.folders:
-                folder_path = self.folders[key]
-                os.makedirs(folder_path, exist_ok=True)
-                print(f"  {key}: {folder_path}/")
+        for key in missing:
+            folder_path = self.folders[key]
+            os.makedirs(folder_path, exist_ok=True)
+            print(f"  {key}: {folder_path}/")
 
         print("✅ Directory structure ready!")
 
@@ -78,26 +185,27 @@ class BaseAnalyzer(ABC):
         for key in folders_to_clean:
             if key in self.folders:
                 folder_path = self.folders[key]
-                if os.path.exists(folder_path):
-                    shutil.rmtree(folder_path)
-                    os.makedirs(folder_path, exist_ok=True)
+                if os.path.isdir(folder_path):
+                    # Empty the folder in place rather than removing and
+                    # recreating it; the result folders are flat
+                    with os.scandir(folder_path) as entries:
+                        for entry in entries:
+                            if entry.is_dir(follow_symlinks=False):
+                                shutil.rmtree(entry.path)
+                            else:
+                                os.unlink(entry.path)
                     print(f"  Cleaned: {folder_path}/")
 
         print("✅ Cleanup complete!")
 
     def get_video_files(self) -> List[str]:
         """Get all video files from the input directory"""
-        video_files = []
-        input_dir = self.folders['videos']
-
-        for ext in self.config.VIDEO_EXTENSIONS:
-            # Check both lowercase and uppercase extensions
-            for case_ext in [ext.lower(), ext.upper()]:
-                pattern = os.path.join(input_dir, f'*{case_ext}')
-                video_files.extend([f for f in os.listdir(input_dir)
-                                    if f.lower().endswith(ext.lower())])
-
-        return [os.path.join(input_dir, f) for f in set(video_files)]
+        # One pass over the directory; lowercasing each extension once
+        # covers .MP4, .Mov, ... as well as .mp4
+        with os.scandir(self.folders['videos']) as entries:
+            return [entry.path for entry in entries
+                    if entry.is_file()
+                    and os.path.splitext(entry.name)[1].lower() in VIDEO_EXTENSIONS]
 
     def get_video_name(self, video_path: str) -> str:
         """Extract clean video name from path"""
@@ -108,9 +216,7 @@ class BaseAnalyzer(ABC):
         try:
             results_path = os.path.join(self.folders[folder_key], filename)
 
-            with open(results_path, 'w') as f:
-                import json
-                json.dump(data, f, indent=2, default=str)
+            dump_json(data, results_path)
 
             print(f"💾 Results saved: {results_path}")
             return results_path
@@ -124,6 +230,42 @@ class BaseAnalyzer(ABC):
         """Analyze a single video - must be implemented by subclasses"""
         pass
 
+    def analyze_numbered_video(self, number: int, total: int, video_path: str) -> Optional[dict]:
+        """Analyze one video of a batch under a PROCESSING VIDEO banner"""
+        print(f"\n{'='*60}")
+        print(f"PROCESSING VIDEO {number}/{total}")
+        print(f"{'='*60}")
+        return self.analyze_video(video_path)
+
+    def analyze_videos(self, video_files: List[str], max_workers: Optional[int] = None) -> List[Optional[dict]]:
+        """
+        Analyze several videos, in parallel worker processes when there is
+        more than one
+
+        Args:
+            video_files: Paths of the videos to analyze
+            max_workers: Worker processes to use (default: one per CPU, at
+                most one per video). 1 analyzes them here, one after another.
+
+        Returns:
+            One result per video, in order (None where the analysis failed)
+        """
+        total = len(video_files)
+        jobs = [(i, total, video_path) for i, video_path in enumerate(video_files, 1)]
+        if max_workers is None:
+            max_workers = min(os.cpu_count() or 1, total)
+        if max_workers <= 1:
+            return [self.analyze_numbered_video(*job) for job in jobs]
+
+        # Each worker builds its own analyzer (models and extractors needn't be
+        # picklable). Workers are spawned rather than forked: the web server
+        # is threaded and may have TensorFlow loaded, neither fork-safe
+        with ProcessPoolExecutor(max_workers=max_workers,
+                                 mp_context=multiprocessing.get_context('spawn'),
+                                 initializer=_init_worker,
+                                 initargs=(type(self),)) as executor:
+            return list(executor.map(_analyze_in_worker, jobs))
+
     def analyze_all_videos(self) -> List[dict]:
         """Analyze all videos in the input directory"""
         video_files = self.get_video_files()
@@ -133,22 +275,14 @@ class BaseAnalyzer(ABC):
             print(
                 f"Please place video files in the '{self.folders['videos']}' folder")
             print(
-                f"Supported formats: {', '.join(self.config.VIDEO_EXTENSIONS)}")
+                f"Supported formats: {', '.join(sorted(VIDEO_EXTENSIONS))}")
             return []
 
         print(f"\n🎬 Found {len(video_files)} video file(s) to analyze:")
         for video in video_files:
             print(f"  • {os.path.basename(video)}")
 
-        results = []
-        for i, video_path in enumerate(video_files, 1):
-            print(f"\n{'='*60}")
-            print(f"PROCESSING VIDEO {i}/{len(video_files)}")
-            print(f"{'='*60}")
-
-            result = self.analyze_video(video_path)
-            if result:
-                results.append(result)
+        results = [r for r in self.analyze_videos(video_files) if r]
 
         print(
             f"\n✅ Analysis complete! Processed {len(results)} videos successfully.")
@@ -0,0 +1,130 @@
+#!/usr/bin/env python3
+"""
+Helpers for reusing work across analyses: content-addressed cache entries
+on disk and matplotlib figures kept for a whole process
+"""
+
+import functools
+import hashlib
+import os
+import pickle
+import threading
+
+# Folder for memoized analyses (meow features, enhanced video results)
+CACHE_DIR = '.cache'
+
+# Project root, which the source files passed to code_version are relative to
+PROJECT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def file_digest(file_path: str, chunk_size: int = 1 << 20) -> str:
+    """
+    blake2b hex digest of a file's content, streamed so memory stays flat
+    however large the file is
+    """
+    with open(file_path, 'rb') as f:
+        # Python 3.11+: hashed in C through one reused buffer
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(f, 'blake2b').hexdigest()
+        digest = hashlib.blake2b()
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def code_version(*source_files: str) -> str:
+    """
+    Short digest of the given project source files and the librosa version.
+    Part of every cache key, so cached results are not reused once the code
+    (thresholds and rules included) or librosa that produced them changes.
+    """
+    import librosa
+
+    version = hashlib.blake2b(librosa.__version__.encode(), digest_size=8)
+    for source_file in source_files:
+        version.update(file_digest(os.path.join(PROJECT_DIR, source_file)).encode())
+    return version.hexdigest()
+
+
+def load_cache_entry(cache_path: str):
+    """Return the value cached at cache_path, or None if there is none usable"""
+    if not os.path.exists(cache_path):
+        return None
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except Exception as e:
+        print(f"⚠️ Ignoring unreadable cache entry {cache_path}: {e}")
+        return None
+
+
+def store_cache_entry(cache_path: str, value) -> None:
+    """
+    Cache value at cache_path. Written to a temporary file and renamed into
+    place, so concurrent workers never read a half-written entry.
+    """
+    os.makedirs(os.path.dirname(cache_path) or '.', exist_ok=True)
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(value, f)
+        os.replace(tmp_path, cache_path)
+    except BaseException:
+        # Don't leave a stray partial file behind in the cache folder
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+class ReusableFigure:
+    """
+    A figure created on first use and cleared for every later drawing, so a
+    batch doesn't set up a new figure, axes and fonts for every graph. It is
+    shared by every call in the process: draw while holding `lock` (web
+    requests run in threads).
+    """
+
+    def __init__(self, create):
+        """
+        Args:
+            create: Builds the figure; returns a tuple whose first item is
+                the matplotlib Figure (followed by its axes etc.)
+        """
+        self._create = create
+        self._figure = None
+        self.lock = threading.Lock()
+
+    def get(self):
+        """Return the tuple built by create, cleared for a new drawing"""
+        if self._figure is None:
+            self._figure = self._create()
+        else:
+            import matplotlib
+
+            fig = self._figure[0]
+            for ax in fig.axes:
+                ax.clear()
+            # Start tight_layout from the default spacing again, not from the
+            # previous drawing's layout, so every image comes out the same as
+            # from a fresh figure
+            fig.subplots_adjust(**{param: matplotlib.rcParams[f'figure.subplot.{param}']
+                                   for param in ('left', 'right', 'bottom', 'top',
+                                                 'wspace', 'hspace')})
+        return self._figure
+
+
+def save_figure_png(fig, path: str) -> None:
+    """
+    Render fig once on its Agg canvas and let Pillow write a lightly
+    compressed PNG - savefig(bbox_inches='tight') renders twice and uses
+    zlib's slower default level (call tight_layout first to trim it)
+    """
+    import numpy as np
+    from PIL import Image
+
+    fig.canvas.draw()
+    Image.fromarray(np.asarray(fig.canvas.buffer_rgba())).convert('RGB').save(
+        path, compress_level=1)
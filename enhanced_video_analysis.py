@@ -6,11 +6,14 @@ Combines traditional analysis with advanced ML techniques
 
 from ml_analysis import AdvancedCatBehaviorAnalyzer
 from analysis import analyze_cat_meow, interpret_meow
-from core.base_analyzer import BaseAnalyzer
+from core.base_analyzer import BaseAnalyzer, dump_json
 from core.audio_extractor import UnifiedAudioExtractor
-import matplotlib.pyplot as plt
+from core.reuse_helpers import (CACHE_DIR, ReusableFigure, code_version, file_digest,
+                                load_cache_entry, save_figure_png, store_cache_entry)
+from config import VISUALIZATION_MIN_CONFIDENCE
+import importlib.util
 import os
-import json
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import numpy as np
 
@@ -18,13 +21,49 @@ import numpy as np
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 
-# Try to import moviepy with fallback
-try:
-    from moviepy import VideoFileClip
-    MOVIEPY_AVAILABLE = True
-except ImportError:
+# Check for moviepy without importing it (it is only a fallback extractor,
+# imported by UnifiedAudioExtractor if it is ever used)
+MOVIEPY_AVAILABLE = importlib.util.find_spec('moviepy') is not None
+if not MOVIEPY_AVAILABLE:
     print("⚠️ MoviePy not available, enhanced analysis disabled")
-    MOVIEPY_AVAILABLE = False
+
+
+# ML predictions that agree with a traditional emotional state (matched
+# when the key appears in the state), built once rather than per video
+COMPATIBLE_EMOTIONS = {
+    'content': frozenset({'calm', 'vocal'}),
+    'excited': frozenset({'excited', 'active'}),
+    'distressed': frozenset({'vocal', 'active'}),
+    'attention-seeking': frozenset({'vocal', 'excited'})
+}
+
+# Activity pie of the visualization: one full wedge for the reported level
+# (the interpretation only reports these four), precomputed per level
+ACTIVITY_LABELS = ('High', 'Medium', 'Low', 'Unknown')
+ACTIVITY_PIE_VALUES = {
+    level.lower(): tuple(int(label == level) for label in ACTIVITY_LABELS)
+    for level in ACTIVITY_LABELS
+}
+
+def _create_viz_figure():
+    """Create the (fig, axes) enhanced visualizations are drawn on"""
+    # pyplot is imported on first use: analyzers that never draw (worker
+    # processes of low-confidence batches, the web service) skip it
+    import matplotlib.pyplot as plt
+
+    # 150 dpi: a quarter of the pixels of the previous 300 dpi export,
+    # still sharp for the 15x12 inch page
+    return plt.subplots(2, 2, figsize=(15, 12), dpi=150)
+
+
+# Figure reused for every visualization drawn by this process
+_VIZ_FIGURE = ReusableFigure(_create_viz_figure)
+
+
+# Modules whose code decides an enhanced result: feature extraction, the
+# interpretation rules, the ML analyzer and this combination step
+RESULT_SOURCE_FILES = ('analysis.py', 'ml_analysis.py', 'enhanced_video_analysis.py',
+                       'config.py')
 
 
 class EnhancedCatVideoAnalyzer(BaseAnalyzer):
@@ -37,6 +76,8 @@ class EnhancedCatVideoAnalyzer(BaseAnalyzer):
         super().__init__(required_folders)
         self.ml_analyzer = AdvancedCatBehaviorAnalyzer()
         self.audio_extractor = UnifiedAudioExtractor()
+        # Minimum overall confidence for drawing the enhanced visualization
+        self.viz_threshold = VISUALIZATION_MIN_CONFIDENCE
 
     def extract_audio_from_video(self, video_path):
         """Extract audio from video file using unified extractor"""
@@ -148,15 +189,7 @@ class EnhancedCatVideoAnalyzer(BaseAnalyzer):
                 trad_emotion = traditional['emotional_state'].lower()
                 ml_emotion = ml['ml_prediction'].lower()
 
-                # Define emotion compatibility
-                compatible_emotions = {
-                    'content': ['calm', 'vocal'],
-                    'excited': ['excited', 'active'],
-                    'distressed': ['vocal', 'active'],
-                    'attention-seeking': ['vocal', 'excited']
-                }
-
-                if any(ml_emotion in compat for emotion, compat in compatible_emotions.items() if emotion in trad_emotion):
+                if any(ml_emotion in compat for emotion, compat in COMPATIBLE_EMOTIONS.items() if emotion in trad_emotion):
                     agreements += 1
                     validation['supporting_evidence'].append(
                         f"Emotional state agreement: {trad_emotion} ↔ {ml_emotion}")
@@ -247,6 +280,11 @@ class EnhancedCatVideoAnalyzer(BaseAnalyzer):
                 recommendations.extend(
                     [f"ML analysis: {rec}" for rec in ml['recommendations'][:3]])
 
+            # Both methods already filled every slot; anything added below
+            # would be cut by the limit
+            if len(recommendations) >= 6:
+                return recommendations
+
             # Combined insights
             if traditional and ml:
                 recommendations.append(
@@ -282,8 +320,7 @@ class EnhancedCatVideoAnalyzer(BaseAnalyzer):
             results_path = os.path.join(
                 self.folders['combined_results'], f"{video_name}_enhanced_analysis.json")
 
-            with open(results_path, 'w') as f:
-                json.dump(combined_analysis, f, indent=2, default=str)
+            dump_json(combined_analysis, results_path)
 
             print(f"💾 Enhanced results saved: {results_path}")
             return results_path
@@ -292,91 +329,22 @@ class EnhancedCatVideoAnalyzer(BaseAnalyzer):
             print(f"❌ Error saving enhanced results: {e}")
             return None
 
+    def wants_visualization(self, combined_analysis):
+        """Whether the analysis is confident enough to be worth drawing"""
+        confidence = combined_analysis.get('confidence_assessment', {})
+        return confidence.get('overall_score', 0) >= self.viz_threshold
+
     def create_analysis_visualization(self, combined_analysis):
         """Create visualization of the enhanced analysis"""
         try:
             video_name = combined_analysis['video_name']
-
-            fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(
-                2, 2, figsize=(15, 12))
-            fig.suptitle(
-                f'Enhanced Cat Behavior Analysis: {video_name}', fontsize=16, fontweight='bold')
-
-            # Confidence comparison
-            conf = combined_analysis.get('confidence_assessment', {})
-            methods = ['Traditional', 'ML', 'Combined']
-            scores = [
-                conf.get('traditional_confidence', 0),
-                conf.get('ml_confidence', 0),
-                conf.get('overall_score', 0)
-            ]
-
-            ax1.bar(methods, scores, color=['#FF6B6B', '#4ECDC4', '#45B7D1'])
-            ax1.set_title('Analysis Confidence Scores')
-            ax1.set_ylabel('Confidence Score')
-            ax1.set_ylim(0, 1)
-
-            # Analysis method comparison
-            traditional = combined_analysis.get('traditional_analysis', {})
-            ml = combined_analysis.get('ml_analysis', {})
-
-            categories = ['Emotional\nState', 'Vocal\nPatterns',
-                          'Activity\nLevel', 'Overall\nBehavior']
-            trad_scores = [0.8 if traditional.get('emotional_state') else 0,
-                           0.9 if traditional.get('primary_meaning') else 0, 0.3, 0.6]
-            ml_scores = [0.7, 0.6, 0.9 if ml.get('ml_prediction') else 0, 0.8]
-
-            x = np.arange(len(categories))
-            width = 0.35
-
-            ax2.bar(x - width/2, trad_scores, width,
-                    label='Traditional', color='#FF6B6B', alpha=0.7)
-            ax2.bar(x + width/2, ml_scores, width,
-                    label='ML', color='#4ECDC4', alpha=0.7)
-            ax2.set_title('Analysis Coverage by Method')
-            ax2.set_ylabel('Coverage Score')
-            ax2.set_xticks(x)
-            ax2.set_xticklabels(categories)
-            ax2.legend()
-
-            # Behavioral insights pie chart
-            enhanced = combined_analysis.get('enhanced_interpretation', {})
-            activity_level = enhanced.get('activity_level', 'unknown')
-
-            activity_data = {'High': 0, 'Medium': 0, 'Low': 0, 'Unknown': 0}
-            activity_data[activity_level.capitalize()] = 1
-
-            colors = ['#FF6B6B', '#FFD93D', '#6BCF7F', '#A8A8A8']
-            ax3.pie(activity_data.values(), labels=activity_data.keys(),
-                    colors=colors, autopct='%1.0f%%')
-            ax3.set_title('Activity Level Assessment')
-
-            # Recommendations word cloud simulation
-            recommendations = combined_analysis.get(
-                'comprehensive_recommendations', [])
-            rec_text = ' '.join(recommendations)
-
-            # Simple text display instead of word cloud
-            ax4.text(0.1, 0.9, 'Key Recommendations:', fontsize=14,
-                     fontweight='bold', transform=ax4.transAxes)
-
-            y_pos = 0.8
-            for i, rec in enumerate(recommendations[:5]):
-                ax4.text(0.1, y_pos - i*0.12, f"• {rec[:60]}{'...' if len(rec) > 60 else ''}",
-                         fontsize=10, transform=ax4.transAxes, wrap=True)
-
-            ax4.set_xlim(0, 1)
-            ax4.set_ylim(0, 1)
-            ax4.axis('off')
-            ax4.set_title('Analysis Recommendations')
-
-            plt.tight_layout()
-
-            # Save visualization
             viz_path = os.path.join(
                 self.folders['video_results'], f"{video_name}_enhanced_visualization.png")
-            plt.savefig(viz_path, dpi=300, bbox_inches='tight')
-            plt.close()
+
+            # The figure is shared by every call in this process, so only one
+            # visualization is drawn at a time (web requests run in threads)
+            with _VIZ_FIGURE.lock:
+                self._draw_analysis_visualization(combined_analysis, viz_path)
 
             print(f"📊 Enhanced visualization saved: {viz_path}")
             return viz_path
@@ -385,6 +353,129 @@ class EnhancedCatVideoAnalyzer(BaseAnalyzer):
             print(f"❌ Error creating visualization: {e}")
             return None
 
+    def _draw_analysis_visualization(self, combined_analysis, viz_path):
+        """Draw the enhanced analysis on the shared figure and save it to viz_path"""
+        fig, ((ax1, ax2), (ax3, ax4)) = _VIZ_FIGURE.get()
+        fig.suptitle(
+            f"Enhanced Cat Behavior Analysis: {combined_analysis['video_name']}",
+            fontsize=16, fontweight='bold')
+
+        # Confidence comparison
+        conf = combined_analysis.get('confidence_assessment', {})
+        methods = ['Traditional', 'ML', 'Combined']
+        scores = [
+            conf.get('traditional_confidence', 0),
+            conf.get('ml_confidence', 0),
+            conf.get('overall_score', 0)
+        ]
+
+        ax1.bar(methods, scores, color=['#FF6B6B', '#4ECDC4', '#45B7D1'])
+        ax1.set_title('Analysis Confidence Scores')
+        ax1.set_ylabel('Confidence Score')
+        ax1.set_ylim(0, 1)
+
+        # Analysis method comparison
+        traditional = combined_analysis.get('traditional_analysis', {})
+        ml = combined_analysis.get('ml_analysis', {})
+
+        categories = ['Emotional\nState', 'Vocal\nPatterns',
+                      'Activity\nLevel', 'Overall\nBehavior']
+        trad_scores = [0.8 if traditional.get('emotional_state') else 0,
+                       0.9 if traditional.get('primary_meaning') else 0, 0.3, 0.6]
+        ml_scores = [0.7, 0.6, 0.9 if ml.get('ml_prediction') else 0, 0.8]
+
+        x = np.arange(len(categories))
+        width = 0.35
+
+        ax2.bar(x - width/2, trad_scores, width,
+                label='Traditional', color='#FF6B6B', alpha=0.7)
+        ax2.bar(x + width/2, ml_scores, width,
+                label='ML', color='#4ECDC4', alpha=0.7)
+        ax2.set_title('Analysis Coverage by Method')
+        ax2.set_ylabel('Coverage Score')
+        ax2.set_xticks(x)
+        ax2.set_xticklabels(categories)
+        ax2.legend()
+
+        # Behavioral insights pie chart
+        enhanced = combined_analysis.get('enhanced_interpretation', {})
+        activity_level = enhanced.get('activity_level', 'unknown')
+
+        activity_data = ACTIVITY_PIE_VALUES.get(
+            activity_level.lower(), ACTIVITY_PIE_VALUES['unknown'])
+
+        colors = ['#FF6B6B', '#FFD93D', '#6BCF7F', '#A8A8A8']
+        ax3.pie(activity_data, labels=ACTIVITY_LABELS,
+                colors=colors, autopct='%1.0f%%')
+        ax3.set_title('Activity Level Assessment')
+
+        # Recommendations word cloud simulation
+        recommendations = combined_analysis.get(
+            'comprehensive_recommendations', [])
+        rec_text = ' '.join(recommendations)
+
+        # Simple text display instead of word cloud
+        ax4.text(0.1, 0.9, 'Key Recommendations:', fontsize=14,
+                 fontweight='bold', transform=ax4.transAxes)
+
+        y_pos = 0.8
+        for i, rec in enumerate(recommendations[:5]):
+            ax4.text(0.1, y_pos - i*0.12, f"• {rec[:60]}{'...' if len(rec) > 60 else ''}",
+                     fontsize=10, transform=ax4.transAxes, wrap=True)
+
+        ax4.set_xlim(0, 1)
+        ax4.set_ylim(0, 1)
+        ax4.axis('off')
+        ax4.set_title('Analysis Recommendations')
+
+        fig.tight_layout()
+
+        save_figure_png(fig, viz_path)
+
+    def _results_cache_path(self, video_path):
+        """
+        Where a previous enhanced analysis of this exact video is kept, keyed
+        by the video's content hash, the analysis code that produced it and
+        the trained models it was analyzed with (retraining replaces the
+        model files and so changes the key)
+        """
+        digest = file_digest(video_path)
+        model_stamps = []
+        for model_file in ('behavior_classifier.h5', 'ensemble_models.joblib'):
+            try:
+                stat = os.stat(os.path.join(self.folders['models'], model_file))
+                model_stamps.append(f"{stat.st_size}.{stat.st_mtime_ns}")
+            except OSError:
+                model_stamps.append('none')
+        key = f"enhanced-{code_version(*RESULT_SOURCE_FILES)}-{digest}-{'-'.join(model_stamps)}"
+        return os.path.join(CACHE_DIR, f"{key}.pkl")
+
+    def _reuse_cached_results(self, combined_analysis, video_name):
+        """
+        Finish a video from its cached enhanced analysis: rewrite its results
+        file (result folders are emptied between runs) and redraw the figure
+        only if it is gone
+        """
+        print(f"♻️ Using cached enhanced analysis for: {video_name}")
+        # The same content may have been seen under another file name, and
+        # the timestamp records this run rather than the cached one
+        combined_analysis['video_name'] = video_name
+        combined_analysis['timestamp'] = datetime.now().isoformat()
+        self.save_enhanced_results(combined_analysis)
+        viz_path = os.path.join(
+            self.folders['video_results'], f"{video_name}_enhanced_visualization.png")
+        if self.wants_visualization(combined_analysis) and not os.path.exists(viz_path):
+            self.create_analysis_visualization(combined_analysis)
+        self.print_enhanced_summary(combined_analysis)
+        return combined_analysis
+
+    def _cache_results(self, cache_path, combined_analysis):
+        """Store an enhanced analysis for _reuse_cached_results"""
+        try:
+            store_cache_entry(cache_path, combined_analysis)
+        except Exception as e:
+            print(f"⚠️ Could not cache enhanced analysis: {e}")
+
     def analyze_video(self, video_path):
         """Perform comprehensive enhanced analysis on a single video"""
         try:
@@ -397,15 +488,38 @@ class EnhancedCatVideoAnalyzer(BaseAnalyzer):
             print(f"\n🎬 Starting enhanced analysis for: {video_name}")
             print("=" * 60)
 
+            # An unchanged video analyzed with the same code and models gives
+            # the same result
+            try:
+                cache_path = self._results_cache_path(video_path)
+            except OSError:
+                cache_path = None
+            cached = load_cache_entry(cache_path) if cache_path else None
+
             # Extract audio
             audio_path = self.extract_audio_from_video(video_path)
             if not audio_path:
                 print("❌ Cannot proceed without audio")
                 return None
 
-            # Perform both analyses
-            traditional_results = self.perform_traditional_analysis(audio_path)
-            ml_results = self.perform_ml_analysis(audio_path, video_path)
+            if cached is not None:
+                # The extracted audio and its meow graph are part of every
+                # run's output, so only the ML analysis and the combination
+                # are skipped. The meow analysis restores its graph from its
+                # own cache without redoing the feature work.
+                self.perform_traditional_analysis(audio_path)
+                return self._reuse_cached_results(cached, video_name)
+
+            # Perform both analyses. They are independent and spend most of
+            # their time in librosa/NumPy/OpenCV code that releases the GIL,
+            # so they run side by side (only the traditional one plots)
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                traditional_future = executor.submit(
+                    self.perform_traditional_analysis, audio_path)
+                ml_future = executor.submit(
+                    self.perform_ml_analysis, audio_path, video_path)
+                traditional_results = traditional_future.result()
+                ml_results = ml_future.result()
 
             # Combine results
             combined_analysis = self.combine_analyses(
@@ -416,9 +530,18 @@ class EnhancedCatVideoAnalyzer(BaseAnalyzer):
 
             # Save results
             results_path = self.save_enhanced_results(combined_analysis)
-
-            # Create visualization
-            viz_path = self.create_analysis_visualization(combined_analysis)
+            # Only complete analyses are cached: a failed traditional or ML
+            # step must be retried next time, not replayed from the cache
+            if cache_path and traditional_results and ml_results:
+                self._cache_results(cache_path, combined_analysis)
+
+            # Create visualization (the heaviest step) unless confidence is too
+            # low for it to be useful
+            if self.wants_visualization(combined_analysis):
+                viz_path = self.create_analysis_visualization(combined_analysis)
+            else:
+                print("📊 Skipping enhanced visualization: confidence below "
+                      f"{self.viz_threshold:.2f}, results need verification")
 
             # Print summary
             self.print_enhanced_summary(combined_analysis)
@@ -488,13 +611,8 @@ def main():
     print("• Enhanced visualizations")
     print("=" * 50)
 
-    # Analyze all videos in input folder
-    video_extensions = ['.mp4', '.avi', '.mov', '.mkv', '.wmv']
-    video_files = []
-
-    for ext in video_extensions:
-        video_files.extend([f for f in os.listdir(analyzer.folders['videos'])
-                           if f.lower().endswith(ext.lower())])
+    # Analyze all videos in input folder (one directory pass)
+    video_files = analyzer.get_video_files()
 
     if not video_files:
         print("❌ No video files found in input_videos/ folder")
@@ -503,9 +621,9 @@ def main():
 
     print(f"📹 Found {len(video_files)} video(s) to analyze")
 
-    for video_file in video_files:
-        video_path = os.path.join(analyzer.folders['videos'], video_file)
-        analyzer.analyze_video(video_path)
+    # Videos are independent: analyze them in parallel worker processes,
+    # each with its own analyzer (models loaded once per worker)
+    analyzer.analyze_videos(video_files)
 
     print("\n✅ Enhanced analysis complete for all videos!")
 
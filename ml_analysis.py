@@ -4,14 +4,12 @@ Advanced Machine Learning Cat Behavior Analysis
 Uses neural networks and sophisticated ML techniques for enhanced accuracy
 """
 
-from core.base_analyzer import BaseAnalyzer
+from core.base_analyzer import BaseAnalyzer, dump_json
 import cv2
 import librosa
 import numpy as np
-import matplotlib.pyplot as plt
 import matplotlib
 import os
-import json
 from datetime import datetime
 import warnings
 warnings.filterwarnings('ignore')
@@ -546,8 +544,7 @@ class AdvancedCatBehaviorAnalyzer(BaseAnalyzer):
         try:
             results_path = os.path.join(
                 self.folders['features'], f"{video_name}_ml_analysis.json")
-            with open(results_path, 'w') as f:
-                json.dump(analysis, f, indent=2, default=str)
+            dump_json(analysis, results_path)
             print(f"💾 ML analysis saved: {results_path}")
             return results_path
         except Exception as e:
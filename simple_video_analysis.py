@@ -8,7 +8,7 @@ Works with basic dependencies and provides audio + basic visual analysis
 from config import *
 
 from analysis import analyze_cat_meow, interpret_meow, print_analysis_results
-from core.base_analyzer import BaseAnalyzer
+from core.base_analyzer import BaseAnalyzer, dump_json
 from core.audio_extractor import UnifiedAudioExtractor
 import cv2
 import numpy as np
@@ -16,7 +16,6 @@ import matplotlib.pyplot as plt
 import os
 import glob
 from datetime import datetime
-import json
 
 
 class SimpleCatVideoAnalyzer(BaseAnalyzer):
@@ -411,8 +410,7 @@ class SimpleCatVideoAnalyzer(BaseAnalyzer):
             results_path = os.path.join(
                 self.folders['combined_results'], f"{video_name}_combined_analysis.json")
 
-            with open(results_path, 'w') as f:
-                json.dump(correlation_data, f, indent=2, default=str)
+            dump_json(correlation_data, results_path)
 
             print(f"💾 Combined results saved: {results_path}")
             return results_path
@@ -573,16 +571,8 @@ class SimpleCatVideoAnalyzer(BaseAnalyzer):
         for video in video_files:
             print(f"  • {os.path.basename(video)}")
 
-        # Analyze each video
-        results = []
-        for i, video_path in enumerate(video_files, 1):
-            print(f"\n{'='*60}")
-            print(f"PROCESSING VIDEO {i}/{len(video_files)}")
-            print(f"{'='*60}")
-
-            result = self.analyze_video(video_path)
-            if result:
-                results.append(result)
+        # Analyze each video (in parallel worker processes)
+        results = [r for r in self.analyze_videos(video_files) if r]
 
         print(
             f"\n✅ Analysis complete! Processed {len(results)} videos successfully.")
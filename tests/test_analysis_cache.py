@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+Test that repeated meow analyses of an unchanged recording are served from
+the on-disk cache, graph included
+"""
+
+import os
+import sys
+import tempfile
+
+import librosa
+import numpy as np
+import soundfile as sf
+
+from analysis import analyze_cat_meow
+
+
+def test_second_analysis_is_a_cache_hit():
+    """The second analysis skips loading and still leaves the graph behind"""
+    print("🧪 Testing the meow analysis cache...")
+
+    sr = 22050
+    t = np.arange(sr) / sr
+    y = (0.5 * np.sin(2 * np.pi * (600 + 300 * t) * t)).astype(np.float32)
+
+    original_cwd = os.getcwd()
+    original_load = librosa.load
+    loads = []
+
+    def counting_load(*args, **kwargs):
+        loads.append(args[0])
+        return original_load(*args, **kwargs)
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        os.chdir(work_dir)
+        librosa.load = counting_load
+        try:
+            sf.write('meow.wav', y, sr)
+
+            first = analyze_cat_meow('meow.wav')
+            assert os.path.exists('meow_analysis_meow.png')
+            with open('meow_analysis_meow.png', 'rb') as f:
+                graph = f.read()
+            # The video pipelines move the graph away after every analysis
+            os.rename('meow_analysis_meow.png', 'moved.png')
+
+            second = analyze_cat_meow('meow.wav')
+        finally:
+            librosa.load = original_load
+            os.chdir(original_cwd)
+
+        assert len(loads) == 1, f"recording loaded {len(loads)} times"
+        assert second == first
+        with open(os.path.join(work_dir, 'meow_analysis_meow.png'), 'rb') as f:
+            assert f.read() == graph
+    print("✅ Second analysis served from the cache, graph restored")
+
+
+def main():
+    """Run all cache tests"""
+    try:
+        test_second_analysis_is_a_cache_hit()
+    except AssertionError as e:
+        print(f"❌ test_second_analysis_is_a_cache_hit failed: {e}")
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Test that dump_json writes the same document through orjson and through
+the stdlib fallback
+"""
+
+import json
+import os
+import sys
+import tempfile
+from datetime import datetime
+
+import numpy as np
+
+import core.base_analyzer as base_analyzer
+from core.base_analyzer import dump_json
+
+
+def _payload():
+    """Analysis-like results mixing numpy values, NaN, emoji and datetimes"""
+    samples = np.array([[0.1, 1.5, np.nan], [2.25, -np.inf, 0.3]], dtype=np.float32)
+    return {
+        'video_name': 'café_cat',
+        'timestamp': datetime(2024, 5, 1, 12, 30),
+        'avg_pitch': np.float32(612.7),
+        'avg_loudness': np.float64(0.0421),
+        'pitch_variation': float('nan'),
+        'segments': np.int64(7),
+        'is_vocal': np.bool_(True),
+        'pitch_contour': samples,
+        'every_other_frame': samples[:, ::2],  # non-contiguous
+        'half_precision': np.array([0.5, 0.1], dtype=np.float16),
+        'recommendations': ['🐱 Play more', '⚠️ Check with a vet'],
+        'behavioral_insights': {'range': (np.float32(0.25), float('inf'))},
+        3: 'non-string key',
+    }
+
+
+def test_orjson_and_stdlib_write_the_same_document():
+    """Both writers produce documents that parse to the same value"""
+    print("🧪 Testing dump_json with and without orjson...")
+
+    if not base_analyzer.ORJSON_AVAILABLE:
+        print("⚠️ orjson not installed, only the stdlib writer can be checked")
+        return
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        orjson_path = os.path.join(work_dir, 'orjson.json')
+        stdlib_path = os.path.join(work_dir, 'stdlib.json')
+
+        dump_json(_payload(), orjson_path)
+        base_analyzer.ORJSON_AVAILABLE = False
+        try:
+            dump_json(_payload(), stdlib_path)
+        finally:
+            base_analyzer.ORJSON_AVAILABLE = True
+
+        with open(orjson_path, encoding='utf-8') as f:
+            orjson_text = f.read()
+        with open(stdlib_path, encoding='utf-8') as f:
+            stdlib_text = f.read()
+
+    assert json.loads(orjson_text) == json.loads(stdlib_text)
+    for text in (orjson_text, stdlib_text):
+        assert '🐱 Play more' in text
+        assert 'NaN' not in text and 'Infinity' not in text
+    print("✅ Same document from both writers")
+
+
+def main():
+    """Run all dump_json tests"""
+    try:
+        test_orjson_and_stdlib_write_the_same_document()
+    except AssertionError as e:
+        print(f"❌ test_orjson_and_stdlib_write_the_same_document failed: {e}")
+        return False
+    return True
+
+
+if __name__ == "__main__":
+    success = main()
+    sys.exit(0 if success else 1)
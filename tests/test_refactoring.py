@@ -185,14 +185,16 @@ def test_web_app():
     print("\n🧪 Testing web app...")
 
     try:
-        from web_app import app, analysis_service
+        from web_app import app, get_analysis_service
 
         # Test Flask app creation
         assert app is not None
         print("✅ Flask app created successfully")
 
-        # Test analysis service
+        # Test analysis service (created on first use)
+        analysis_service = get_analysis_service()
         assert analysis_service is not None
+        assert get_analysis_service() is analysis_service
         print("✅ Analysis service initialized")
 
         # Test that we can get status
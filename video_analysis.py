@@ -1,5 +1,5 @@
 from analysis import analyze_cat_meow, interpret_meow, print_analysis_results
-from core.base_analyzer import BaseAnalyzer
+from core.base_analyzer import BaseAnalyzer, dump_json
 from core.audio_extractor import UnifiedAudioExtractor
 import cv2
 import numpy as np
@@ -9,7 +9,6 @@ import librosa.display
 import os
 import glob
 from datetime import datetime
-import json
 import warnings
 warnings.filterwarnings('ignore')
 
@@ -262,8 +261,7 @@ class CatVideoAnalyzer(BaseAnalyzer):
             results_path = os.path.join(
                 self.folders['combined_results'], f"{video_name}_combined_analysis.json")
 
-            with open(results_path, 'w') as f:
-                json.dump(correlation_data, f, indent=2, default=str)
+            dump_json(correlation_data, results_path)
 
             print(f"💾 Combined results saved: {results_path}")
             return results_path
@@ -383,16 +381,8 @@ class CatVideoAnalyzer(BaseAnalyzer):
         for video in video_files:
             print(f"  • {os.path.basename(video)}")
 
-        # Analyze each video
-        results = []
-        for i, video_path in enumerate(video_files, 1):
-            print(f"\n{'='*60}")
-            print(f"PROCESSING VIDEO {i}/{len(video_files)}")
-            print(f"{'='*60}")
-
-            result = self.analyze_video(video_path)
-            if result:
-                results.append(result)
+        # Analyze each video (in parallel worker processes)
+        results = [r for r in self.analyze_videos(video_files) if r]
 
         print(
             f"\n✅ Analysis complete! Processed {len(results)} videos successfully.")
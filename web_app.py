@@ -10,6 +10,7 @@ from config import *
 from flask import Flask, render_template, send_file, request, jsonify, redirect, url_for, flash
 import os
 import glob
+import threading
 from datetime import datetime
 from werkzeug.utils import secure_filename
 from core.analysis_service import AnalysisService
@@ -29,15 +30,28 @@ def allowed_file(filename):
     return '.' in filename and filename.rsplit('.', 1)[1] in ALLOWED_EXTENSIONS
 
 
-# Initialize the analysis service
-analysis_service = AnalysisService()
+# The analysis service is created on first use rather than at import:
+# analysis workers are spawned processes that re-import this module (as
+# __mp_main__ when started with `python3 web_app.py`), and each would
+# otherwise build a service and its analyzer of its own
+_analysis_service = None
+_ANALYSIS_SERVICE_LOCK = threading.Lock()
+
+
+def get_analysis_service():
+    """Return the shared analysis service, creating it on first use"""
+    global _analysis_service
+    with _ANALYSIS_SERVICE_LOCK:
+        if _analysis_service is None:
+            _analysis_service = AnalysisService()
+    return _analysis_service
 
 
 @app.route('/')
 def index():
     """Main page showing analysis results"""
     # Load existing results if any
-    results = analysis_service.load_results()
+    results = get_analysis_service().load_results()
 
     # Check if there are videos to analyze
     video_files = glob.glob('input_videos/*.MOV') + glob.glob('input_videos/*.mov') + \
@@ -53,9 +67,11 @@ def index():
 
 @app.route('/analyze', methods=['POST'])
 def run_analysis():
-    """Run the cat behavior analysis"""
+    """Run the cat behavior analysis ({"clear_cache": true} re-analyzes from scratch)"""
     try:
-        result = analysis_service.run_analysis()
+        options = request.get_json(silent=True) or {}
+        result = get_analysis_service().run_analysis(
+            clear_cache=bool(options.get('clear_cache', False)))
         return jsonify(result)
     except Exception as e:
         return jsonify({
@@ -67,7 +83,7 @@ def run_analysis():
 @app.route('/results')
 def show_results():
     """Show detailed results page"""
-    results = analysis_service.load_results()
+    results = get_analysis_service().load_results()
     return render_template('results.html', results=results)
 
 
@@ -75,7 +91,7 @@ def show_results():
 def download_results():
     """Download all analysis results as ZIP"""
     try:
-        zip_path = analysis_service.create_download_package()
+        zip_path = get_analysis_service().create_download_package()
         return send_file(zip_path, as_attachment=True, download_name=os.path.basename(zip_path))
     except Exception as e:
         return jsonify({'error': f'Download failed: {str(e)}'}), 500
@@ -173,11 +189,11 @@ def delete_video(filename):
 def download_analysis_report():
     """Generate and download comprehensive analysis report"""
     try:
-        results = analysis_service.load_results()
+        results = get_analysis_service().load_results()
         if not results:
             return jsonify({'error': 'No analysis results available'}), 404
 
-        report_content = analysis_service.generate_analysis_report(results)
+        report_content = get_analysis_service().generate_analysis_report(results)
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         report_filename = f"cat_behavior_analysis_report_{timestamp}.txt"
         report_path = os.path.join('downloads', report_filename)
@@ -196,7 +212,7 @@ def download_analysis_report():
 @app.route('/api/status')
 def get_status():
     """Get current analysis status"""
-    return jsonify(analysis_service.get_status())
+    return jsonify(get_analysis_service().get_status())
 
 
 if __name__ == '__main__':